@@ -4,19 +4,18 @@ import os
 import subprocess
 from typing import Annotated, Optional
 
-import yaml
 from cyclopts import App, Parameter
-from rich.panel import Panel
-from rich.table import Table
 
 from .managers import (
     CATEGORIES,
     CUSTOM_MANAGER,
     MANAGERS,
     load_specs,
+    warmup_managers,
 )
 from .manifest import (
     find_custom_entry,
+    find_manifest,
     find_package_manifest_type,
     get_active_categories,
     get_installed_names,
@@ -30,10 +29,16 @@ from .models import PackageInfo
 from .utils import (
     console,
     detect_shell,
+    dump_yaml,
+    first_hit,
+    has_libyaml,
+    load_yaml,
     platform_matches,
     print_error,
     print_header,
+    print_panel,
     print_success,
+    run_process,
 )
 
 __version__ = "0.6.0"
@@ -79,6 +84,16 @@ def _print_error(message: str):
     print_error(message)
 
 
+def _warmup_categories(filter_types: Optional[set[str]] = None):
+    """Take listings for every manager shown by the active categories, concurrently"""
+    warmup_managers(
+        pkg_type
+        for cat_name in get_active_categories()
+        for pkg_type in CATEGORIES[cat_name]["types"]
+        if not filter_types or pkg_type in filter_types
+    )
+
+
 @app.command
 def init(
     *,
@@ -163,19 +178,22 @@ def init(
             raise SystemExit(1)
 
         with open(lock_path) as f:
-            lock_data = yaml.safe_load(f) or {}
+            lock_data = load_yaml(f) or {}
         console.print(f"[dim]Lock file:[/] {lock_path}")
     data = resolve_all_packages(data)
 
     if dry_run:
-        console.print(Panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow"))
+        print_panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow")
 
-    all_types = list(data.keys())
+    # `list` is shadowed by the list command in this module
+    all_types = [*data]
     if types:
         all_types = [t.strip() for t in types.split(",")]
 
     all_types = reorder_types(all_types)
 
+    warmup_managers(all_types)
+
     if not quiet:
         console.print(f"[dim]Manifest:[/] {path}")
         console.print(f"[dim]Package types:[/] {', '.join(all_types)}")
@@ -191,12 +209,11 @@ def init(
         if pkg_type == "custom":
             specs = load_specs()
             pkg_names = [p for p in packages if p in specs]
-            missing = []
-
-            for name in pkg_names:
-                pkg_config = CUSTOM_MANAGER.parse_config(name, specs[name])
-                if not CUSTOM_MANAGER.is_installed(pkg_config):
-                    missing.append(name)
+            pkg_configs = {
+                name: CUSTOM_MANAGER.parse_config(name, specs[name]) for name in pkg_names
+            }
+            checks = CUSTOM_MANAGER.check_installed([*pkg_configs.values()])
+            missing = [name for name, installed in zip(pkg_names, checks) if not installed]
 
             if not missing:
                 if not quiet:
@@ -212,7 +229,7 @@ def init(
                 )
 
             for name in missing:
-                pkg_config = CUSTOM_MANAGER.parse_config(name, specs[name])
+                pkg_config = pkg_configs[name]
                 if not quiet:
                     console.print(f"\n  [magenta]{name}[/]")
                     if pkg_config.depends:
@@ -288,9 +305,9 @@ def init(
         console.print()
     if error_count == 0:
         if not quiet:
-            console.print(Panel("[green]All packages installed successfully![/]", style="green"))
+            print_panel("[green]All packages installed successfully![/]", style="green")
     else:
-        console.print(Panel(f"[yellow]Completed with {error_count} error(s)[/]", style="yellow"))
+        print_panel(f"[yellow]Completed with {error_count} error(s)[/]", style="yellow")
 
 
 @app.command
@@ -350,10 +367,10 @@ def install(
       onepkg install python ruff
       onepkg install go github.com/jesseduffield/lazygit
     """
-    data, raw_data, path = load_manifest(env)
+    _, raw_data, path = load_manifest(env)
 
     if dry_run:
-        console.print(Panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow"))
+        print_panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow")
 
     if pkg_type == "custom":
         specs = load_specs()
@@ -372,14 +389,9 @@ def install(
 
         if not force and CUSTOM_MANAGER.is_installed(pkg_config):
             console.print(f"[green]✓[/] {name} is already installed (use --force to reinstall)")
-            if not dry_run:
-                custom_list = data.get("custom", [])
-                if name not in custom_list:
-                    if "custom" not in raw_data:
-                        raw_data["custom"] = []
-                    raw_data["custom"].append(name)
-                    save_manifest(raw_data, path)
-                    console.print(f"[dim]Added to manifest:[/] {path}")
+            if not dry_run and update_raw_manifest(raw_data, "custom", name, "add"):
+                save_manifest(raw_data, path)
+                console.print(f"[dim]Added to manifest:[/] {path}")
             return
 
         _print_header("Installing", pkg_type, [name])
@@ -390,14 +402,9 @@ def install(
 
         if result.success:
             _print_success()
-            if not dry_run:
-                custom_list = data.get("custom", [])
-                if name not in custom_list:
-                    if "custom" not in raw_data:
-                        raw_data["custom"] = []
-                    raw_data["custom"].append(name)
-                    save_manifest(raw_data, path)
-                    console.print(f"[dim]Added to manifest:[/] {path}")
+            if not dry_run and update_raw_manifest(raw_data, "custom", name, "add"):
+                save_manifest(raw_data, path)
+                console.print(f"[dim]Added to manifest:[/] {path}")
         else:
             _print_error(result.message or "Installation failed")
             raise SystemExit(1)
@@ -414,11 +421,9 @@ def install(
             )
             if is_installed:
                 console.print(f"[green]✓[/] {name} is already installed (use --force to reinstall)")
-                if not dry_run:
-                    if name not in data.get(pkg_type, []):
-                        update_raw_manifest(raw_data, pkg_type, name, "add")
-                        save_manifest(raw_data, path)
-                        console.print(f"[dim]Added to manifest:[/] {path}")
+                if not dry_run and update_raw_manifest(raw_data, pkg_type, name, "add"):
+                    save_manifest(raw_data, path)
+                    console.print(f"[dim]Added to manifest:[/] {path}")
                 return
 
         _print_header("Installing", pkg_type, [name])
@@ -426,11 +431,9 @@ def install(
 
         if result.success:
             _print_success()
-            if not dry_run:
-                if name not in data.get(pkg_type, []):
-                    update_raw_manifest(raw_data, pkg_type, name, "add")
-                    save_manifest(raw_data, path)
-                    console.print(f"[dim]Added to manifest:[/] {path}")
+            if not dry_run and update_raw_manifest(raw_data, pkg_type, name, "add"):
+                save_manifest(raw_data, path)
+                console.print(f"[dim]Added to manifest:[/] {path}")
         else:
             _print_error(result.message or "Installation failed")
             raise SystemExit(1)
@@ -459,7 +462,7 @@ def remove(
     data, raw_data, path = load_manifest(env)
 
     if dry_run:
-        console.print(Panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow"))
+        print_panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow")
 
     # Auto-detect type if not provided
     if not pkg_type:
@@ -481,8 +484,7 @@ def remove(
         result = CUSTOM_MANAGER.remove(pkg_config, dry_run=dry_run)
         if result.success:
             _print_success()
-            if not dry_run and not keep:
-                update_raw_manifest(raw_data, "custom", name, "remove")
+            if not dry_run and not keep and update_raw_manifest(raw_data, "custom", name, "remove"):
                 save_manifest(raw_data, path)
                 console.print(f"[dim]Removed from manifest:[/] {path}")
         else:
@@ -499,8 +501,7 @@ def remove(
 
         if result.success:
             _print_success()
-            if not dry_run and not keep:
-                update_raw_manifest(raw_data, pkg_type, name, "remove")
+            if not dry_run and not keep and update_raw_manifest(raw_data, pkg_type, name, "remove"):
                 save_manifest(raw_data, path)
                 console.print(f"[dim]Removed from manifest:[/] {path}")
         else:
@@ -538,6 +539,8 @@ def list(
     if types:
         filter_types = set(t.strip() for t in types.split(","))
 
+    _warmup_categories(filter_types)
+
     for cat_name in get_active_categories():
         cat = CATEGORIES[cat_name]
         cat_types = cat["types"]
@@ -575,15 +578,22 @@ def list(
                 specs = load_specs()
                 console.print(f"  [{CUSTOM_MANAGER.color}]{pkg_type}[/]")
 
+                known = [name for name in custom_list if name in specs]
+                checks = CUSTOM_MANAGER.check_installed(
+                    [CUSTOM_MANAGER.parse_config(name, specs[name]) for name in known]
+                )
+                installed_custom = {name for name, ok in zip(known, checks) if ok}
+
+                lines = []
                 for name in custom_list:
                     if name in specs:
-                        pkg_config = CUSTOM_MANAGER.parse_config(name, specs[name])
-                        if CUSTOM_MANAGER.is_installed(pkg_config):
-                            console.print(f"    [green]●[/] {name}")
+                        if name in installed_custom:
+                            lines.append(f"    [green]●[/] {name}")
                         else:
-                            console.print(f"    [red]○[/] {name}")
+                            lines.append(f"    [red]○[/] {name}")
                     else:
-                        console.print(f"    [dim]?[/] {name} [dim](no spec)[/]")
+                        lines.append(f"    [dim]?[/] {name} [dim](no spec)[/]")
+                console.print("\n".join(lines))
             else:
                 manager = MANAGERS.get(pkg_type)
                 if not manager:
@@ -591,7 +601,7 @@ def list(
 
                 manifest_pkgs = set(data.get(pkg_type, []))
                 if manager.is_available():
-                    installed = manager.get_installed_packages()
+                    installed = manager.installed_snapshot()
                     installed_names = {p.name for p in installed}
                 else:
                     installed_names = set()
@@ -602,18 +612,22 @@ def list(
                 status = "[green]✓[/]" if manager.is_available() else "[red]✗[/]"
                 console.print(f"  [{manager.color}]{pkg_type}[/] {status}")
 
-                # Show tracked packages
-                for name in sorted(manifest_pkgs):
-                    if name in installed_names:
-                        console.print(f"    [green]●[/] {name}")
-                    else:
-                        console.print(f"    [red]○[/] {name}")
+                # Render the section as one block; a print per package pays Rich's
+                # per-call render overhead hundreds of times
+                lines = [
+                    f"    [green]●[/] {name}"
+                    if name in installed_names
+                    else f"    [red]○[/] {name}"
+                    for name in sorted(manifest_pkgs)
+                ]
 
                 # Show untracked if verbose
                 if verbose:
                     untracked = installed_names - manifest_pkgs
-                    for name in sorted(untracked):
-                        console.print(f"    [dim]○ {name}[/]")
+                    lines.extend(f"    [dim]○ {name}[/]" for name in sorted(untracked))
+
+                if lines:
+                    console.print("\n".join(lines))
 
         console.print()
 
@@ -641,7 +655,7 @@ def update(
     data, raw_data, path = load_manifest(env)
 
     if dry_run:
-        console.print(Panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow"))
+        print_panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow")
 
     if name:
         # Update specific package
@@ -657,10 +671,7 @@ def update(
         else:
             # Search all managers
             for mgr_type, mgr in MANAGERS.items():
-                if not mgr.is_available():
-                    continue
-                installed = get_installed_names(mgr)
-                if name in installed:
+                if mgr.is_available() and mgr.has_package(name):
                     manager = mgr
                     pkg_type = mgr_type
                     break
@@ -676,7 +687,8 @@ def update(
             _print_error(result.message or "Update failed")
     else:
         # Update all
-        for pkg_type in reorder_types(list(MANAGERS.keys())):
+        # `list` is shadowed by the list command in this module
+        for pkg_type in reorder_types([*MANAGERS]):
             manager = MANAGERS[pkg_type]
             if not manager.is_available():
                 continue
@@ -697,10 +709,13 @@ def status(
     ] = None,
 ):
     """Show status of package managers and manifest."""
+    from rich.table import Table
+
     data, raw_data, path = load_manifest(env)
     data = resolve_all_packages(data)
 
     console.print(f"[dim]Manifest:[/] {path}\n")
+    _warmup_categories()
 
     for cat_name in get_active_categories():
         cat = CATEGORIES[cat_name]
@@ -717,10 +732,13 @@ def status(
                 custom_list = data.get("custom", [])
                 specs = load_specs()
                 installed_count = sum(
-                    1
-                    for name in custom_list
-                    if name in specs
-                    and CUSTOM_MANAGER.is_installed(CUSTOM_MANAGER.parse_config(name, specs[name]))
+                    CUSTOM_MANAGER.check_installed(
+                        [
+                            CUSTOM_MANAGER.parse_config(name, specs[name])
+                            for name in custom_list
+                            if name in specs
+                        ]
+                    )
                 )
                 table.add_row(
                     pkg_type,
@@ -737,7 +755,7 @@ def status(
                 is_avail = manager.is_available()
                 status = "[green]✓[/]" if is_avail else "[red]✗[/]"
                 tracked = len(data.get(pkg_type, []))
-                installed = len(manager.get_installed_packages()) if is_avail else 0
+                installed = len(manager.installed_snapshot()) if is_avail else 0
 
                 table.add_row(
                     pkg_type,
@@ -777,6 +795,8 @@ def diff(
     if types:
         filter_types = set(t.strip() for t in types.split(","))
 
+    _warmup_categories(filter_types)
+
     total_missing = 0
     total_untracked = 0
 
@@ -803,9 +823,13 @@ def diff(
 
                 if missing:
                     console.print(f"[bold {CUSTOM_MANAGER.color}]{pkg_type}[/]")
-                    for name in sorted(missing):
-                        console.print(f"  [red]+ {name}[/] [dim](not installed)[/]")
-                        total_missing += 1
+                    console.print(
+                        "\n".join(
+                            f"  [red]+ {name}[/] [dim](not installed)[/]"
+                            for name in sorted(missing)
+                        )
+                    )
+                    total_missing += len(missing)
                     console.print()
             else:
                 manager = MANAGERS.get(pkg_type)
@@ -813,7 +837,7 @@ def diff(
                     continue
 
                 manifest_pkgs = set(data.get(pkg_type, []))
-                installed_packages = manager.get_installed_packages()
+                installed_packages = manager.installed_snapshot()
                 installed_names = {p.name for p in installed_packages}
 
                 missing = manifest_pkgs - installed_names
@@ -824,30 +848,28 @@ def diff(
 
                 console.print(f"[bold {manager.color}]{pkg_type}[/]")
 
-                for name in sorted(missing):
-                    console.print(f"  [red]+ {name}[/] [dim](not installed)[/]")
-                    total_missing += 1
-
-                for name in sorted(untracked):
-                    console.print(f"  [yellow]- {name}[/] [dim](untracked)[/]")
-                    total_untracked += 1
+                # One print per section, as in list
+                lines = [f"  [red]+ {name}[/] [dim](not installed)[/]" for name in sorted(missing)]
+                lines.extend(
+                    f"  [yellow]- {name}[/] [dim](untracked)[/]" for name in sorted(untracked)
+                )
+                console.print("\n".join(lines))
+                total_missing += len(missing)
+                total_untracked += len(untracked)
 
                 console.print()
 
     if total_missing == 0 and total_untracked == 0:
-        console.print(Panel("[green]Everything is in sync![/]", style="green"))
+        print_panel("[green]Everything is in sync![/]", style="green")
     else:
         summary_parts = []
         if total_missing > 0:
             summary_parts.append(f"[red]{total_missing} missing[/]")
         if total_untracked > 0:
             summary_parts.append(f"[yellow]{total_untracked} untracked[/]")
-        console.print(
-            Panel(
-                " | ".join(summary_parts)
-                + "\n[dim]Run 'onepkg init' to install missing packages[/]",
-                style="cyan",
-            )
+        print_panel(
+            " | ".join(summary_parts) + "\n[dim]Run 'onepkg init' to install missing packages[/]",
+            style="cyan",
         )
 
 
@@ -874,6 +896,7 @@ def export(
         filter_types = set(t.strip() for t in types.split(","))
 
     export_data: dict[str, dict[str, list[str]]] = {}
+    _warmup_categories(filter_types)
 
     for cat_name in get_active_categories():
         cat = CATEGORIES[cat_name]
@@ -890,7 +913,7 @@ def export(
             if not manager or not manager.is_available():
                 continue
 
-            installed = manager.get_installed_packages()
+            installed = manager.installed_snapshot()
             if not installed:
                 continue
 
@@ -907,8 +930,7 @@ def export(
                 export_data[cat_name][pkg_type] = pkg_names
 
     if format == "yaml":
-        yaml_output = yaml.dump(export_data, default_flow_style=False, sort_keys=False)
-        print(yaml_output)
+        print(dump_yaml(export_data))
 
 
 @app.command
@@ -925,7 +947,7 @@ def bootstrap(
       onepkg bootstrap rust
     """
     if dry_run:
-        console.print(Panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow"))
+        print_panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow")
 
     managers_to_install = []
 
@@ -975,6 +997,7 @@ def show(
 
     found_details = None
     found_type = None
+    found_manager = None
 
     # Check custom packages first
     if pkg_type == "custom" or pkg_type is None:
@@ -984,49 +1007,52 @@ def show(
             if details:
                 found_details = details
                 found_type = "custom"
+                found_manager = CUSTOM_MANAGER
 
     if not found_details:
         if pkg_type and pkg_type != "custom":
             managers_to_check = [(pkg_type, MANAGERS.get(pkg_type))]
         elif pkg_type is None:
-            managers_to_check = list(MANAGERS.items())
+            managers_to_check = MANAGERS.items()
         else:
             managers_to_check = []
 
-        for type_name, manager in managers_to_check:
+        def probe(item):
+            _, manager = item
             if not manager or not manager.is_available():
-                continue
-            details = manager.get_package_details(name)
-            if details:
-                found_details = details
-                found_type = type_name
-                break
+                return None
+            return manager.cached_details(name)
+
+        # Each probe waits on its own tool, so ask the managers concurrently
+        # and take the first hit in MANAGERS order once those ahead of it
+        # have missed; probes not yet started are cancelled
+        hit = first_hit(probe, managers_to_check)
+        if hit:
+            (found_type, found_manager), found_details = hit
 
     if not found_details:
         console.print(f"[red]Error:[/] Package '{name}' not found")
         raise SystemExit(1)
 
-    # Display
-    if found_type == "custom":
-        color = CUSTOM_MANAGER.color
-    else:
-        color = MANAGERS[found_type].color
-
-    console.print(f"[bold {color}]{found_details.name}[/] [dim]v{found_details.version}[/]")
-    console.print(f"[dim]Type:[/] {found_type}")
-
+    # Collect the fields and render them with a single print
+    color = found_manager.color
+    lines = [
+        f"[bold {color}]{found_details.name}[/] [dim]v{found_details.version}[/]",
+        f"[dim]Type:[/] {found_type}",
+    ]
     if found_details.summary:
-        console.print(f"\n{found_details.summary}")
+        lines.append(f"\n{found_details.summary}")
     if found_details.homepage:
-        console.print(f"\n[dim]Homepage:[/] {found_details.homepage}")
+        lines.append(f"\n[dim]Homepage:[/] {found_details.homepage}")
     if found_details.license:
-        console.print(f"[dim]License:[/] {found_details.license}")
+        lines.append(f"[dim]License:[/] {found_details.license}")
     if found_details.location:
-        console.print(f"[dim]Location:[/] {found_details.location}")
+        lines.append(f"[dim]Location:[/] {found_details.location}")
     if found_details.requires:
-        console.print(f"[dim]Requires:[/] {', '.join(found_details.requires)}")
+        lines.append(f"[dim]Requires:[/] {', '.join(found_details.requires)}")
     if found_details.binaries:
-        console.print(f"[dim]Binaries:[/] {', '.join(found_details.binaries)}")
+        lines.append(f"[dim]Binaries:[/] {', '.join(found_details.binaries)}")
+    console.print("\n".join(lines))
 
 
 @app.command
@@ -1037,12 +1063,15 @@ def edit(
     ] = None,
 ):
     """Open the manifest file in your editor."""
-    _, _, path = load_manifest(env)
+    path = find_manifest(env)
     editor = os.environ.get("EDITOR", "vim")
     console.print(f"[dim]Opening:[/] {path}")
+    console.file.flush()
 
+    # Nothing runs after the editor, so hand the process over to it; its exit
+    # status becomes ours
     try:
-        subprocess.run([editor, str(path)], check=True)
+        os.execvp(editor, [editor, str(path)])
     except FileNotFoundError:
         console.print(f"[red]Error:[/] Editor '{editor}' not found")
         raise SystemExit(1)
@@ -1070,6 +1099,7 @@ def search(
     console.print(f"[dim]Searching for:[/] {query}\n")
 
     found_in = []
+    warmup_managers(filter_types or MANAGERS)
 
     for pkg_type, manager in MANAGERS.items():
         if filter_types and pkg_type not in filter_types:
@@ -1077,7 +1107,7 @@ def search(
         if not manager.is_available():
             continue
 
-        installed = manager.get_installed_packages()
+        installed = manager.installed_snapshot()
         matches = [p for p in installed if query.lower() in p.name.lower()]
 
         if matches:
@@ -1089,7 +1119,7 @@ def search(
         if brew_manager and brew_manager.is_available():
             try:
                 shell = detect_shell()
-                result = subprocess.run(
+                result = run_process(
                     [shell, "-l", "-c", f"brew search {query}"],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.DEVNULL,
@@ -1164,7 +1194,7 @@ def doctor(
     data, raw_data, path = load_manifest(env)
     data = resolve_all_packages(data)
 
-    console.print(Panel("[bold]Package Manager Doctor[/]", style="cyan"))
+    print_panel("[bold]Package Manager Doctor[/]", style="cyan")
     console.print()
 
     issues, warnings, ok_items = [], [], []
@@ -1203,6 +1233,13 @@ def doctor(
     if missing_count == 0:
         ok_items.append("All manifest packages are installed")
 
+    if has_libyaml():
+        ok_items.append("PyYAML is using LibYAML")
+    else:
+        warnings.append(
+            "PyYAML was built without LibYAML; YAML parsing uses the slower Python loader"
+        )
+
     for item in ok_items:
         console.print(f"[green]✓[/] {item}")
     if warnings:
@@ -1216,11 +1253,11 @@ def doctor(
 
     console.print()
     if issues:
-        console.print(Panel(f"[red]Found {len(issues)} issue(s)[/]", style="red"))
+        print_panel(f"[red]Found {len(issues)} issue(s)[/]", style="red")
     elif warnings:
-        console.print(Panel(f"[yellow]Found {len(warnings)} warning(s)[/]", style="yellow"))
+        print_panel(f"[yellow]Found {len(warnings)} warning(s)[/]", style="yellow")
     else:
-        console.print(Panel("[green]Everything looks good![/]", style="green"))
+        print_panel("[green]Everything looks good![/]", style="green")
 
 
 @app.command
@@ -1241,7 +1278,7 @@ def outdated(
     if (not filter_types or "brew" in filter_types) and MANAGERS["brew"].is_available():
         try:
             shell = detect_shell()
-            result = subprocess.run(
+            result = run_process(
                 [shell, "-l", "-c", "brew outdated --formula"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
@@ -1263,7 +1300,7 @@ def outdated(
     if (not filter_types or "cask" in filter_types) and MANAGERS["cask"].is_available():
         try:
             shell = detect_shell()
-            result = subprocess.run(
+            result = run_process(
                 [shell, "-l", "-c", "brew outdated --cask"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
@@ -1281,11 +1318,9 @@ def outdated(
             pass
 
     if total_outdated == 0:
-        console.print(Panel("[green]All packages are up to date![/]", style="green"))
+        print_panel("[green]All packages are up to date![/]", style="green")
     else:
-        console.print(
-            Panel(f"[yellow]{total_outdated} package(s) can be updated[/]", style="yellow")
-        )
+        print_panel(f"[yellow]{total_outdated} package(s) can be updated[/]", style="yellow")
 
 
 @app.command
@@ -1312,7 +1347,7 @@ def clean(
     console.print(f"[dim]Manifest:[/] {path}\n")
 
     if dry_run:
-        console.print(Panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow"))
+        print_panel("[yellow]DRY RUN[/] - No changes will be made", style="yellow")
         console.print()
 
     filter_types = None
@@ -1321,6 +1356,7 @@ def clean(
 
     total_untracked = 0
     to_remove: dict[str, list[str]] = {}
+    warmup_managers(filter_types or MANAGERS)
 
     for pkg_type, manager in MANAGERS.items():
         if filter_types and pkg_type not in filter_types:
@@ -1329,7 +1365,7 @@ def clean(
             continue
 
         manifest_pkgs = set(data.get(pkg_type, []))
-        installed_names = {p.name for p in manager.get_installed_packages()}
+        installed_names = {p.name for p in manager.installed_snapshot()}
         untracked = installed_names - manifest_pkgs
 
         if untracked:
@@ -1337,7 +1373,7 @@ def clean(
             total_untracked += len(untracked)
 
     if total_untracked == 0:
-        console.print(Panel("[green]No untracked packages found![/]", style="green"))
+        print_panel("[green]No untracked packages found![/]", style="green")
         return
 
     console.print(f"[bold]Found {total_untracked} untracked package(s):[/]\n")
@@ -1375,7 +1411,7 @@ def clean(
         else:
             _print_error(result.message or "Removal failed")
 
-    console.print(Panel("[green]Cleaned up untracked packages![/]", style="green"))
+    print_panel("[green]Cleaned up untracked packages![/]", style="green")
 
 
 @app.command
@@ -1423,6 +1459,7 @@ def lock(
 
     lock_data: dict[str, dict[str, str]] = {}
     total_locked = 0
+    warmup_managers(t for t in filter_types or MANAGERS if data.get(t))
 
     for pkg_type, manager in MANAGERS.items():
         if filter_types and pkg_type not in filter_types:
@@ -1434,7 +1471,7 @@ def lock(
         if not manifest_pkgs:
             continue
 
-        installed = manager.get_installed_packages()
+        installed = manager.installed_snapshot()
         installed_map = {p.name: p.version for p in installed}
 
         locked_versions = {}
@@ -1449,9 +1486,7 @@ def lock(
             lock_data[pkg_type] = dict(sorted(locked_versions.items()))
 
     if total_locked == 0:
-        console.print(
-            Panel("[yellow]No packages to lock (none installed from manifest)[/]", style="yellow")
-        )
+        print_panel("[yellow]No packages to lock (none installed from manifest)[/]", style="yellow")
         return
 
     # Write lock file
@@ -1459,7 +1494,7 @@ def lock(
         f.write("# onepkg lock file - DO NOT EDIT\n")
         f.write(f"# Generated from: {manifest_path}\n")
         f.write(f"# Packages: {total_locked}\n\n")
-        yaml.dump(lock_data, f, default_flow_style=False, sort_keys=False)
+        dump_yaml(lock_data, f)
 
     console.print(f"[bold]Locked {total_locked} package(s):[/]\n")
     for pkg_type, versions in lock_data.items():
@@ -1472,7 +1507,7 @@ def lock(
             console.print(f"  [dim]... and {len(versions) - 5} more[/]")
         console.print()
 
-    console.print(Panel(f"[green]Lock file created: {lock_path}[/]", style="green"))
+    print_panel(f"[green]Lock file created: {lock_path}[/]", style="green")
 
 
 @app.command
@@ -1,20 +1,67 @@
 """Package manager implementations."""
 
+import functools
+import hashlib
+import json
 import os
 import re
 import shlex
 import shutil
 import subprocess
 import sys
+import time
 from abc import ABC, abstractmethod
-from importlib import resources
 from pathlib import Path
-from typing import Optional
-
-import yaml
+from typing import Iterable, Iterator, Optional
 
 from .models import CommandResult, CustomPackageConfig, PackageDetails, PackageInfo
-from .utils import console, detect_shell
+from .utils import (
+    console,
+    detect_shell,
+    get_cache_dir,
+    load_yaml,
+    login_path,
+    read_cache,
+    run_parallel,
+    run_process,
+    stream_lines,
+    which,
+    write_cache,
+)
+
+# Patterns for parsing manager output, compiled once at import
+_UV_TOOL_RE = re.compile(r"(\S+)\s+v?(\S+)")  # "ruff v0.4.1"
+_CARGO_CRATE_RE = re.compile(r"(\S+)\s+v(\S+):")  # "ripgrep v14.1.0:"
+_MAS_APP_RE = re.compile(r"(\d+)\s+(.+?)\s+\(([^)]+)\)")  # "497799835 Xcode (15.3)"
+_REQUIREMENT_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")  # "rich>=13; python_version..."
+_DIST_NAME_SEP_RE = re.compile(r"[-_.]+")  # "ruamel.yaml" -> dist-info "ruamel_yaml"
+_COLUMN_GAP_RE = re.compile(r"\s{2,}")  # winget table columns
+
+# Shells whose syntax CustomManager can batch check scripts in
+_POSIX_SHELLS = frozenset({"sh", "bash", "zsh", "ksh", "dash"})
+_CHECK_MARKER = "__onepkg_check__"
+
+
+def _parse_fields(text: str, keys: set[str]) -> dict[str, str]:
+    """Collect the first "Key: value" line for each wanted (lowercase) key"""
+    fields = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key = key.strip().lower()
+        if key in keys and key not in fields:
+            fields[key] = value.strip()
+    return fields
+
+
+def _name_cache_file(name: str) -> str:
+    """Cache file name for a package name.
+
+    Hashed rather than escaped: "a/b" and "a--b", or names differing only in
+    case on a case-insensitive filesystem, must not share a file.
+    """
+    return hashlib.sha1(name.encode()).hexdigest()[:16] + ".pkl"
 
 
 class PackageManager(ABC):
@@ -25,6 +72,12 @@ class PackageManager(ABC):
     tool: str
     # Commands to install this manager itself (platform -> command)
     install_cmds: dict[str, list[str]] = {}
+    # Max concurrent invocations of the tool (1 for tools that lock their own state)
+    max_workers: int = 8
+    # Cached result of get_installed_packages (see installed_snapshot)
+    _snapshot: Optional[tuple[PackageInfo, ...]] = None
+    # Seconds an on-disk listing is trusted even if _state_paths look unchanged
+    listing_ttl: float = 3600.0
 
     @abstractmethod
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
@@ -48,9 +101,101 @@ class PackageManager(ABC):
     def update(self, packages: Optional[list[str]] = None, dry_run: bool = False) -> CommandResult:
         pass
 
+    @functools.cached_property
+    def tool_path(self) -> Optional[str]:
+        """Absolute path of the tool, resolved once per manager instance"""
+        return shutil.which(self.tool)
+
     def is_available(self) -> bool:
         """Check if the package manager tool is available"""
-        return shutil.which(self.tool) is not None
+        return self.tool_path is not None
+
+    def _state_paths(self) -> list[Path]:
+        """
+        Paths whose mtimes change whenever the installed set does.
+
+        Managers that can name such paths get their listing cached on disk
+        across runs; the default (empty) disables that.
+        """
+        return []
+
+    def _state_key(self) -> tuple:
+        """The state paths with their mtimes; empty when they are unknown or missing"""
+        try:
+            return tuple((str(p), p.stat().st_mtime_ns) for p in self._state_paths())
+        except OSError:
+            return ()
+
+    def _read_fresh(self, cache_path: Path, key: tuple) -> Optional[object]:
+        """read_cache, treating entries older than listing_ttl as missing"""
+        try:
+            if time.time() - cache_path.stat().st_mtime >= self.listing_ttl:
+                return None
+        except OSError:
+            return None
+        return read_cache(cache_path, key)
+
+    def _load_listing(self) -> list[PackageInfo]:
+        """get_installed_packages, reusing the on-disk copy while the state paths are unchanged"""
+        key = self._state_key()
+        if not key:
+            return self.get_installed_packages()
+
+        cache_path = get_cache_dir() / "installed" / f"{self.name}.pkl"
+        cached = self._read_fresh(cache_path, key)
+        if cached is not None:
+            return [*cached]
+
+        packages = self.get_installed_packages()
+        write_cache(cache_path, key, tuple(packages))
+        return packages
+
+    def cached_details(self, name: str) -> Optional[PackageDetails]:
+        """
+        get_package_details, reusing the on-disk copy while the state paths are unchanged.
+
+        Details queries start the tool (bun even asks the registry), so repeated
+        `show` calls for the same package are served from the cache instead.
+        Misses are cached too (as False): auto-detect asks every manager, and
+        most of them do not have the package.
+        """
+        key = self._state_key()
+        if not key:
+            return self.get_package_details(name)
+
+        cache_path = get_cache_dir() / "details" / self.name / _name_cache_file(name)
+        cached = self._read_fresh(cache_path, key)
+        if cached is not None:
+            return cached or None
+
+        details = self.get_package_details(name)
+        write_cache(cache_path, key, details or False)
+        return details
+
+    def installed_snapshot(self) -> list[PackageInfo]:
+        """
+        Installed packages, listed once and reused until this manager runs a command.
+
+        Listing means starting the tool (and often a login shell), which costs far
+        more than the parsing; one command such as init may need the same listing
+        several times.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self._load_listing())
+        return [*self._snapshot]
+
+    def has_package(self, name: str) -> bool:
+        """Whether name is installed; managers override this with a cheaper probe where one exists"""
+        return any(p.name == name for p in self.installed_snapshot())
+
+    def invalidate_snapshot(self) -> None:
+        """Forget the cached listing after the installed set may have changed"""
+        self._snapshot = None
+
+    def warmup(self) -> None:
+        """Resolve the tool and take the listing snapshot ahead of use"""
+        if self.is_available():
+            self.installed_snapshot()
 
     def install_self(self, dry_run: bool = False) -> CommandResult:
         """Install this package manager itself"""
@@ -67,24 +212,69 @@ class PackageManager(ABC):
                 success=False,
                 message=f"No install command for {self.name} on {platform}",
             )
-        return self._run_command(cmd, dry_run)
+        result = self._run_command(cmd, dry_run)
+        if result.success and not dry_run:
+            # The tool (and possibly profile PATH edits) now exist; look it up afresh
+            self.__dict__.pop("tool_path", None)
+            which.cache_clear()
+            login_path.cache_clear()
+        return result
+
+    def _argv(self, cmd: list[str]) -> list[str]:
+        """
+        Build the argv to execute cmd.
+
+        onepkg is started from the user's shell and already carries the login
+        environment, so a tool found on PATH is exec'd directly; sourcing the
+        profile again would only add startup time. A tool only the login PATH
+        knows about is resolved against it (read once per run) and exec'd the
+        same way. Anything else (e.g. a tool that was just bootstrapped) goes
+        through a login shell, with every argument quoted by shlex.join.
+        """
+        if cmd[0] == self.tool and self.tool_path:
+            return [self.tool_path, *cmd[1:]]
+        path = which(cmd[0]) or which(cmd[0], login_path())
+        if path:
+            return [path, *cmd[1:]]
+        return [detect_shell(), "-l", "-c", shlex.join(cmd)]
+
+    def _query(self, cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
+        """Run a read-only query, capturing stdout as text"""
+        return run_process(
+            self._argv(cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=check,
+        )
+
+    def _query_lines(self, cmd: list[str]) -> Iterator[str]:
+        """Run a read-only query, yielding stdout lines as they are printed"""
+        return stream_lines(self._argv(cmd))
 
     def _run_command(
-        self, cmd: list[str], dry_run: bool = False, check: bool = True
+        self, cmd: list[str], dry_run: bool = False, check: bool = True, capture: bool = False
     ) -> CommandResult:
-        """Execute a command with proper shell integration"""
-        cmd_str = " ".join(cmd)
+        """Execute a command, echoing it as a shell-quoted line
+
+        With capture, the command's output is collected and printed together
+        with the echo once it exits, so commands running side by side do not
+        interleave their output on the shared terminal.
+        """
+        cmd_str = shlex.join(cmd)
 
         if dry_run:
             console.print(f"  [dim]Would run:[/] {cmd_str}")
             return CommandResult(success=True)
 
-        console.print(f"  [dim]$[/] {cmd_str}")
+        self.invalidate_snapshot()
+        if capture:
+            return self._run_captured(cmd, cmd_str, check)
 
+        console.print(f"  [dim]$[/] {cmd_str}")
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", cmd_str],
+            result = run_process(
+                self._argv(cmd),
                 check=check,
                 capture_output=False,
             )
@@ -92,6 +282,61 @@ class PackageManager(ABC):
         except subprocess.CalledProcessError as e:
             return CommandResult(success=False, message=str(e))
 
+    def _run_captured(self, cmd: list[str], cmd_str: str, check: bool) -> CommandResult:
+        """_run_command's capture path: run to completion, then print echo and output as one block"""
+        from rich.markup import escape
+
+        argv = self._argv(cmd)
+        result = run_process(
+            argv, check=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        output = result.stdout.rstrip()
+        block = f"  [dim]$[/] {cmd_str}"
+        console.print(f"{block}\n{escape(output)}" if output else block)
+
+        if check and result.returncode != 0:
+            error = subprocess.CalledProcessError(result.returncode, argv)
+            return CommandResult(success=False, message=str(error))
+        return CommandResult(success=result.returncode == 0)
+
+    def _run_batch(
+        self, cmd: list[str], packages: list[str], dry_run: bool = False
+    ) -> CommandResult:
+        """Run cmd once with all packages, falling back to one call per package.
+
+        Every invocation pays the tool's startup cost, so the batch is tried
+        first; if it fails, packages are retried individually so a single bad
+        name does not block the rest.
+        """
+        result = self._run_command([*cmd, *packages], dry_run)
+        if result.success or len(packages) <= 1:
+            return result
+
+        console.print("  [yellow]Batch failed, retrying packages one at a time[/]")
+        failed = [pkg for pkg in packages if not self._run_command([*cmd, pkg], dry_run).success]
+        if failed:
+            return CommandResult(success=False, message=f"Failed to process: {', '.join(failed)}")
+        return CommandResult(success=True)
+
+    def _run_each(
+        self, cmd: list[str], packages: list[str], dry_run: bool = False
+    ) -> CommandResult:
+        """Run cmd once per package, up to max_workers at a time.
+
+        For tools that take a single package per call. Dry runs stay serial so
+        the printed plan keeps manifest order; parallel runs capture each
+        call's output so it prints whole.
+        """
+        workers = 1 if dry_run else self.max_workers
+        capture = workers > 1 and len(packages) > 1
+        results = run_parallel(
+            lambda pkg: self._run_command([*cmd, pkg], dry_run, capture=capture), packages, workers
+        )
+        failed = [pkg for pkg, result in zip(packages, results) if not result.success]
+        if failed:
+            return CommandResult(success=False, message=f"Failed to process: {', '.join(failed)}")
+        return CommandResult(success=True)
+
 
 class CondaManager(PackageManager):
     """Conda package manager (via micromamba)"""
@@ -108,10 +353,17 @@ class CondaManager(PackageManager):
         ],
     }
     env_name = "base"
+    max_workers = 1
+
+    def _state_paths(self) -> list[Path]:
+        # conda-meta holds one JSON record per installed package
+        root = Path(os.environ.get("MAMBA_ROOT_PREFIX") or Path.home() / "micromamba")
+        env = root if self.env_name == "base" else root / "envs" / self.env_name
+        return [env / "conda-meta"]
 
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        return self._run_command(
-            ["micromamba", "install", "-n", self.env_name, "-y", *packages], dry_run
+        return self._run_batch(
+            ["micromamba", "install", "-n", self.env_name, "-y"], packages, dry_run
         )
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
@@ -119,57 +371,36 @@ class CondaManager(PackageManager):
             ["micromamba", "remove", "-n", self.env_name, "-y", *packages], dry_run
         )
 
+    def _list_records(self) -> list[dict]:
+        """Package records from `micromamba list --json`"""
+        result = self._query(["micromamba", "list", "-n", self.env_name, "--json"])
+        return json.loads(result.stdout)
+
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get conda packages, excluding pypi-installed ones"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", f"micromamba list -n {self.env_name}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
-            packages = []
-            for line in result.stdout.splitlines():
-                if line.startswith("#") or not line.strip():
-                    continue
-                parts = line.split()
-                if len(parts) >= 3:
-                    name, version, channel = parts[0], parts[1], parts[-1]
-                    if channel == "pypi":
-                        continue
-                    packages.append(PackageInfo(name=name, version=version))
-            return packages
-        except subprocess.CalledProcessError:
+            return [
+                PackageInfo(name=record["name"], version=record["version"])
+                for record in self._list_records()
+                if record.get("channel") != "pypi"
+            ]
+        except (subprocess.CalledProcessError, ValueError, KeyError):
             return []
 
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
         """Get detailed info about a conda package"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", f"micromamba list -n {self.env_name} '^{name}$'"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
-            for line in result.stdout.splitlines():
-                if line.startswith("#") or not line.strip():
-                    continue
-                parts = line.split()
-                if len(parts) >= 4 and parts[0] == name:
-                    pkg_name, version, build, channel = parts[0], parts[1], parts[2], parts[3]
-                    return PackageDetails(
-                        name=pkg_name,
-                        version=version,
-                        location=f"channel: {channel}",
-                        summary=f"build: {build}",
-                    )
+            record = next((r for r in self._list_records() if r.get("name") == name), None)
+        except (subprocess.CalledProcessError, ValueError):
             return None
-        except subprocess.CalledProcessError:
+        if record is None:
             return None
+        return PackageDetails(
+            name=record["name"],
+            version=record.get("version", "unknown"),
+            location=f"channel: {record.get('channel', '')}",
+            summary=f"build: {record.get('build_string', '')}",
+        )
 
     def update(self, packages: Optional[list[str]] = None, dry_run: bool = False) -> CommandResult:
         if packages:
@@ -191,6 +422,7 @@ class PythonManager(PackageManager):
     }
 
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
+        # `uv tool install` takes exactly one package, so this cannot be batched
         for pkg in packages:
             result = self._run_command(["uv", "tool", "install", pkg, "--force"], dry_run)
             if not result.success:
@@ -198,100 +430,128 @@ class PythonManager(PackageManager):
         return CommandResult(success=True)
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        for pkg in packages:
-            result = self._run_command(["uv", "tool", "uninstall", pkg], dry_run)
-            if not result.success:
-                return result
-        return CommandResult(success=True)
+        return self._run_batch(["uv", "tool", "uninstall"], packages, dry_run)
 
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get uv tool packages"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "uv tool list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
-            packages = []
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if not line or line.startswith("-"):
-                    continue
-                match = re.match(r"^(\S+)\s+v?(\S+)$", line)
-                if match:
-                    packages.append(PackageInfo(name=match.group(1), version=match.group(2)))
-            return packages
+            return [
+                PackageInfo(name=name, version=version)
+                for name, version, _ in self._iter_tools(self._query_lines(["uv", "tool", "list"]))
+            ]
         except subprocess.CalledProcessError:
             return []
 
+    @staticmethod
+    def _iter_tools(lines: Iterable[str]) -> Iterator[tuple[str, str, list[str]]]:
+        """
+        Parse `uv tool list` output into (name, version, binaries) per tool.
+
+        Each tool's "- binary" lines follow its "name vX.Y" line, so a tool is
+        yielded once the next one starts (or the output ends).
+        """
+        current = None
+        for line in lines:
+            line = line.strip()
+            if line.startswith("-"):
+                if current:
+                    current[2].append(line.lstrip("- "))
+                continue
+            match = _UV_TOOL_RE.fullmatch(line)
+            if match:
+                if current:
+                    yield current
+                current = (match.group(1), match.group(2), [])
+        if current:
+            yield current
+
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
         """Get detailed info about a python tool package"""
         try:
-            shell = detect_shell()
-            packages = self.get_installed_packages()
-            pkg_info = next((p for p in packages if p.name == name), None)
-            if not pkg_info:
-                return None
+            # A tool is installed iff uv created its venv; the version and
+            # entry points are on disk, so no `uv tool list` is needed
+            dist_info = self._find_dist_info(self._tool_dir / name, name)
+            if dist_info is None:
+                return self._details_from_listing(name)
+
+            from email.parser import BytesParser
+
+            with open(dist_info / "METADATA", "rb") as f:
+                metadata = BytesParser().parse(f, headersonly=True)
+            details = PackageDetails(name=name, version=metadata.get("Version", "unknown"))
+            details.summary = metadata.get("Summary", "")
+            details.license = metadata.get("License", "")
+            details.homepage = metadata.get("Home-page", "")
+            for url in metadata.get_all("Project-URL") or []:
+                label, _, link = url.partition(",")
+                if not details.homepage and label.strip().lower() == "homepage":
+                    details.homepage = link.strip()
+            details.location = str(dist_info.parent)
+            details.requires = [
+                _REQUIREMENT_NAME_RE.match(req).group(0)
+                for req in metadata.get_all("Requires-Dist") or []
+                if "extra ==" not in req
+            ]
+            details.binaries = self._entry_points(dist_info)
+            return details
+        except Exception:
+            return None
 
-            home = os.path.expanduser("~")
-            tool_path = os.path.join(home, ".local", "share", "uv", "tools", name)
-            pip_path = os.path.join(tool_path, "bin", "pip")
+    def has_package(self, name: str) -> bool:
+        # uv keeps one venv per installed tool, named after it
+        if self._tool_dir.is_dir():
+            return (self._tool_dir / name).is_dir()
+        return super().has_package(name)
+
+    def _details_from_listing(self, name: str) -> Optional[PackageDetails]:
+        """Fallback for tool dirs we cannot find: one `uv tool list` pass"""
+        tools = self._iter_tools(self._query_lines(["uv", "tool", "list"]))
+        for tool, version, binaries in tools:
+            if tool == name:
+                tools.close()
+                return PackageDetails(name=name, version=version, binaries=binaries)
+        return None
 
-            details = PackageDetails(name=name, version=pkg_info.version)
+    @functools.cached_property
+    def _tool_dir(self) -> Path:
+        """uv's tool directory, following its UV_TOOL_DIR/XDG_DATA_HOME lookup"""
+        tool_dir = os.environ.get("UV_TOOL_DIR")
+        if tool_dir:
+            return Path(tool_dir)
+        data_home = os.environ.get("XDG_DATA_HOME")
+        base = Path(data_home) if data_home else Path.home() / ".local" / "share"
+        return base / "uv" / "tools"
 
-            if os.path.exists(pip_path):
-                result = subprocess.run(
-                    [pip_path, "show", name],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.DEVNULL,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.splitlines():
-                        if line.startswith("Summary:"):
-                            details.summary = line.split(":", 1)[1].strip()
-                        elif line.startswith("Home-page:"):
-                            details.homepage = line.split(":", 1)[1].strip()
-                        elif line.startswith("License:"):
-                            details.license = line.split(":", 1)[1].strip()
-                        elif line.startswith("Location:"):
-                            details.location = line.split(":", 1)[1].strip()
-                        elif line.startswith("Requires:"):
-                            reqs = line.split(":", 1)[1].strip()
-                            if reqs:
-                                details.requires = [r.strip() for r in reqs.split(",")]
-
-            result = subprocess.run(
-                [shell, "-l", "-c", "uv tool list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-            )
-            if result.returncode == 0:
-                in_package = False
-                for line in result.stdout.splitlines():
-                    if line.startswith(name + " "):
-                        in_package = True
-                    elif in_package:
-                        if line.startswith("-"):
-                            details.binaries.append(line.strip("- ").strip())
-                        elif line.strip() and not line.startswith(" "):
-                            break
+    @staticmethod
+    def _entry_points(dist_info: Path) -> list[str]:
+        """Executables uv links for the tool: its console and GUI scripts"""
+        path = dist_info / "entry_points.txt"
+        if not path.is_file():
+            return []
+        import configparser
+
+        parser = configparser.ConfigParser(delimiters=("=",), interpolation=None)
+        parser.optionxform = str
+        parser.read(path, encoding="utf-8")
+        return [
+            script
+            for section in ("console_scripts", "gui_scripts")
+            if parser.has_section(section)
+            for script in parser.options(section)
+        ]
 
-            return details
-        except Exception:
-            return None
+    @staticmethod
+    def _find_dist_info(tool_dir: Path, name: str) -> Optional[Path]:
+        """Locate the tool's own .dist-info directory inside its uv-managed venv"""
+        wanted = _DIST_NAME_SEP_RE.sub("_", name).lower()
+        for dist_info in tool_dir.glob("lib/python*/site-packages/*.dist-info"):
+            if dist_info.name.split("-", 1)[0].lower() == wanted:
+                return dist_info
+        return None
 
     def update(self, packages: Optional[list[str]] = None, dry_run: bool = False) -> CommandResult:
         if packages:
-            for pkg in packages:
-                result = self._run_command(["uv", "tool", "upgrade", pkg], dry_run)
-                if not result.success:
-                    return result
-            return CommandResult(success=True)
+            return self._run_batch(["uv", "tool", "upgrade"], packages, dry_run)
         return self._run_command(["uv", "tool", "upgrade", "--all"], dry_run)
 
 
@@ -309,26 +569,48 @@ class RustManager(PackageManager):
         ],
     }
 
+    def _state_paths(self) -> list[Path]:
+        # cargo rewrites its install tracking file on every install/uninstall
+        cargo_home = Path(os.environ.get("CARGO_HOME") or Path.home() / ".cargo")
+        return [cargo_home / ".crates2.json"]
+
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        return self._run_command(["cargo", "install", "--locked", *packages], dry_run)
+        return self._run_batch(["cargo", "install", "--locked"], packages, dry_run)
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
         return self._run_command(["cargo", "uninstall", *packages], dry_run)
 
+    def _read_crates(self) -> Optional[list[PackageDetails]]:
+        """
+        Installed crates straight from cargo's .crates2.json.
+
+        This is the file `cargo install --list` itself reads, so parsing it
+        skips cargo's startup. Keys look like
+        "ripgrep 14.1.0 (registry+https://...)". Returns None when the file is
+        missing or unreadable so callers can fall back to cargo.
+        """
+        try:
+            with open(self._state_paths()[0], "rb") as f:
+                installs = json.load(f)["installs"]
+            crates = []
+            for key, entry in installs.items():
+                crate_name, version = key.split(" ", 2)[:2]
+                crates.append(
+                    PackageDetails(name=crate_name, version=version, binaries=entry.get("bins", []))
+                )
+            return crates
+        except (OSError, ValueError, KeyError, AttributeError):
+            return None
+
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get cargo installed packages"""
+        crates = self._read_crates()
+        if crates is not None:
+            return [PackageInfo(name=crate.name, version=crate.version) for crate in crates]
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "cargo install --list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
             packages = []
-            for line in result.stdout.splitlines():
-                match = re.match(r"^(\S+)\s+v(\S+):$", line)
+            for line in self._query_lines(["cargo", "install", "--list"]):
+                match = _CARGO_CRATE_RE.fullmatch(line.rstrip("\n"))
                 if match:
                     packages.append(PackageInfo(name=match.group(1), version=match.group(2)))
             return packages
@@ -337,19 +619,14 @@ class RustManager(PackageManager):
 
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
         """Get detailed info about a cargo package"""
+        crates = self._read_crates()
+        if crates is not None:
+            return next((crate for crate in crates if crate.name == name), None)
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "cargo install --list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
             current_pkg = None
             binaries = []
-            for line in result.stdout.splitlines():
-                match = re.match(r"^(\S+)\s+v(\S+):$", line)
+            for line in self._query_lines(["cargo", "install", "--list"]):
+                match = _CARGO_CRATE_RE.fullmatch(line.rstrip("\n"))
                 if match:
                     if current_pkg and current_pkg.name == name:
                         current_pkg.binaries = binaries
@@ -385,7 +662,7 @@ class RustManager(PackageManager):
 
     def _is_cargo_update_installed(self) -> bool:
         """Check if cargo-update is installed"""
-        packages = self.get_installed_packages()
+        packages = self.installed_snapshot()
         return any(p.name == "cargo-update" for p in packages)
 
 
@@ -404,24 +681,51 @@ class GoManager(PackageManager):
         ],
     }
 
-    def _get_gobin(self) -> Path:
-        """Get GOBIN or default ~/go/bin"""
+    @functools.cached_property
+    def _gobin(self) -> Path:
+        """GOBIN or default ~/go/bin"""
         gobin = os.environ.get("GOBIN")
         if gobin:
             return Path(gobin)
-        gopath = os.environ.get("GOPATH", os.path.expanduser("~/go"))
-        return Path(gopath) / "bin"
+        # go install writes to the first GOPATH entry's bin
+        gopath = os.environ.get("GOPATH", "").split(os.pathsep)[0]
+        return (Path(gopath) if gopath else Path.home() / "go") / "bin"
+
+    def _state_paths(self) -> list[Path]:
+        # Listing runs `go version -m` per binary; statting them is far cheaper
+        gobin = self._gobin
+        if not gobin.is_dir():
+            return []
+        return [gobin, *sorted(b for b in gobin.iterdir() if b.is_file())]
+
+    def _go_install(self, pkg: str, dry_run: bool, capture: bool = False) -> CommandResult:
+        """Install a single module, defaulting to @latest"""
+        pkg_spec = pkg if "@" in pkg else f"{pkg}@latest"
+        return self._run_command(["go", "install", pkg_spec], dry_run, capture=capture)
+
+    def _go_install_each(self, packages: list[str], dry_run: bool) -> list[CommandResult]:
+        """
+        _go_install per module, up to max_workers at a time.
+
+        Each module needs its own `go install`; they share the build cache
+        safely. Parallel builds capture their compiler output so each prints
+        as one block, and dry runs stay serial to keep manifest order.
+        """
+        workers = 1 if dry_run else self.max_workers
+        capture = workers > 1 and len(packages) > 1
+        return run_parallel(lambda pkg: self._go_install(pkg, dry_run, capture), packages, workers)
 
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        for pkg in packages:
-            pkg_spec = pkg if "@" in pkg else f"{pkg}@latest"
-            result = self._run_command(["go", "install", pkg_spec], dry_run)
-            if not result.success:
-                return result
+        results = self._go_install_each(packages, dry_run)
+        failed = [pkg for pkg, result in zip(packages, results) if not result.success]
+        if failed:
+            return CommandResult(success=False, message=f"Failed to process: {', '.join(failed)}")
         return CommandResult(success=True)
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        gobin = self._get_gobin()
+        gobin = self._gobin
+        if not dry_run:
+            self.invalidate_snapshot()
         for pkg in packages:
             binary_name = pkg.split("/")[-1]
             binary_path = gobin / binary_name
@@ -436,73 +740,57 @@ class GoManager(PackageManager):
                     console.print(f"  [yellow]Not found:[/] {binary_path}")
         return CommandResult(success=True)
 
+    def _inspect_binary(self, binary: Path) -> PackageInfo:
+        """Read the module path and version embedded in a Go binary"""
+        result = self._query(["go", "version", "-m", str(binary)], check=False)
+        if result.returncode != 0:
+            return PackageInfo(name=binary.name, version="unknown")
+
+        mod_path = binary.name
+        version = "unknown"
+        for line in result.stdout.strip().split("\n"):
+            parts = line.strip().split("\t")
+            if len(parts) >= 2:
+                if parts[0] == "path":
+                    mod_path = parts[1]
+                elif parts[0] == "mod" and len(parts) >= 3:
+                    version = parts[2]
+        return PackageInfo(name=mod_path, version=version)
+
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get installed Go binaries with their module paths"""
         try:
-            gobin = self._get_gobin()
+            gobin = self._gobin
             if not gobin.exists():
                 return []
 
-            packages = []
-            shell = detect_shell()
-
-            for binary in gobin.iterdir():
-                if not binary.is_file():
-                    continue
-
-                result = subprocess.run(
-                    [shell, "-l", "-c", f"go version -m {binary}"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.DEVNULL,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split("\n")
-                    mod_path = binary.name
-                    version = "unknown"
-                    for line in lines:
-                        parts = line.strip().split("\t")
-                        if len(parts) >= 2:
-                            if parts[0] == "path":
-                                mod_path = parts[1]
-                            elif parts[0] == "mod" and len(parts) >= 3:
-                                version = parts[2]
-                    packages.append(PackageInfo(name=mod_path, version=version))
-                else:
-                    packages.append(PackageInfo(name=binary.name, version="unknown"))
-
-            return packages
+            binaries = [b for b in gobin.iterdir() if b.is_file()]
+            return run_parallel(self._inspect_binary, binaries, self.max_workers)
         except Exception:
             return []
 
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
         """Get detailed info about a Go package"""
-        packages = self.get_installed_packages()
+        packages = self.installed_snapshot()
         for pkg in packages:
             if pkg.name == name or pkg.name.endswith(f"/{name}"):
                 return PackageDetails(
                     name=pkg.name,
                     version=pkg.version,
-                    location=str(self._get_gobin() / name.split("/")[-1]),
+                    location=str(self._gobin / name.split("/")[-1]),
                     binaries=[name.split("/")[-1]],
                 )
         return None
 
     def update(self, packages: Optional[list[str]] = None, dry_run: bool = False) -> CommandResult:
         if packages:
-            for pkg in packages:
-                pkg_spec = pkg if "@" in pkg else f"{pkg}@latest"
-                result = self._run_command(["go", "install", pkg_spec], dry_run)
-                if not result.success:
-                    return result
-            return CommandResult(success=True)
+            return self.install(packages, dry_run)
         else:
-            installed = self.get_installed_packages()
-            for pkg in installed:
-                if pkg.name != "unknown":
-                    result = self._run_command(["go", "install", f"{pkg.name}@latest"], dry_run)
-                    if not result.success:
-                        console.print(f"  [yellow]Failed to update {pkg.name}[/]")
+            installed = [p.name for p in self.installed_snapshot() if p.name != "unknown"]
+            results = self._go_install_each(installed, dry_run)
+            for name, result in zip(installed, results):
+                if not result.success:
+                    console.print(f"  [yellow]Failed to update {name}[/]")
             return CommandResult(success=True)
 
 
@@ -512,9 +800,10 @@ class BrewManager(PackageManager):
     name = "brew"
     color = "bright_yellow"
     tool = "brew"
+    max_workers = 1
 
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        return self._run_command(["brew", "install", *packages], dry_run)
+        return self._run_batch(["brew", "install"], packages, dry_run)
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
         return self._run_command(["brew", "uninstall", *packages], dry_run)
@@ -522,17 +811,9 @@ class BrewManager(PackageManager):
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get installed brew formulae"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "brew list --formula --versions"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
             packages = []
-            for line in result.stdout.splitlines():
-                parts = line.strip().split()
+            for line in self._query_lines(["brew", "list", "--formula", "--versions"]):
+                parts = line.split()
                 if len(parts) >= 2:
                     name = parts[0]
                     version = parts[-1]
@@ -541,42 +822,90 @@ class BrewManager(PackageManager):
         except subprocess.CalledProcessError:
             return []
 
+    @functools.cached_property
+    def _prefix(self) -> Optional[Path]:
+        """Homebrew prefix, from the environment or the brew binary's location"""
+        prefix = os.environ.get("HOMEBREW_PREFIX")
+        if prefix:
+            return Path(prefix)
+        # <prefix>/bin/brew (not resolved: bin/brew is often a symlink into <prefix>/Homebrew)
+        return Path(self.tool_path).parent.parent if self.tool_path else None
+
+    @functools.cached_property
+    def _cellar(self) -> Optional[Path]:
+        cellar = os.environ.get("HOMEBREW_CELLAR")
+        if cellar:
+            return Path(cellar)
+        prefix = self._prefix
+        return prefix / "Cellar" if prefix else None
+
+    def _state_paths(self) -> list[Path]:
+        # Installs add kegs to Cellar; upgrades repoint the opt/ symlinks
+        prefix, cellar = self._prefix, self._cellar
+        if not prefix or not cellar:
+            return []
+        return [cellar, prefix / "opt"]
+
+    def has_package(self, name: str) -> bool:
+        # Every installed formula has a keg directory in the Cellar
+        if self._cellar:
+            return (self._cellar / name.split("/")[-1]).is_dir()
+        return super().has_package(name)
+
+    def cached_details(self, name: str) -> Optional[PackageDetails]:
+        # get_package_details already caches per keg, which is finer than the Cellar mtime
+        return self.get_package_details(name)
+
+    def _keg_mtime(self, name: str) -> Optional[int]:
+        """mtime of the formula's Cellar directory, which changes on every (un)install"""
+        cellar = self._cellar
+        if not cellar:
+            return None
+        try:
+            return (cellar / name.split("/")[-1]).stat().st_mtime_ns
+        except OSError:
+            return None
+
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
-        """Get detailed info about a brew package"""
+        """Get detailed info about a brew package, cached on disk while its keg is unchanged"""
+        keg_mtime = self._keg_mtime(name)
+        cache_path = get_cache_dir() / "brew-info" / _name_cache_file(name)
+        if keg_mtime is not None:
+            details = read_cache(cache_path, keg_mtime)
+            if details is not None:
+                return details
+
+        details = self._brew_info(name)
+        if details is not None and keg_mtime is not None:
+            write_cache(cache_path, keg_mtime, details)
+        return details
+
+    def _brew_info(self, name: str) -> Optional[PackageDetails]:
+        """Read a formula's details from `brew info --json=v2`"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", f"brew info {name}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
-            lines = result.stdout.splitlines()
-            if not lines:
+            result = self._query(["brew", "info", "--json=v2", name])
+            formula = json.loads(result.stdout)["formulae"][0]
+            installed = formula.get("installed") or []
+            # HEAD-only formulae have no stable version until one is installed
+            version = installed[-1]["version"] if installed else formula["versions"]["stable"]
+            if not version:
                 return None
-
-            first_line = lines[0]
-            match = re.match(r"^==> (\S+): .*?(\d+\.\d+[\.\d]*)", first_line)
-            if match:
-                pkg_name, version = match.group(1), match.group(2)
-            else:
-                pkg_name = name
-                version = "unknown"
-
-            details = PackageDetails(name=pkg_name, version=version)
-
-            for line in lines[1:]:
-                if line.startswith("==>"):
-                    continue
-                if not details.summary and line.strip() and not line.startswith("http"):
-                    details.summary = line.strip()
-                elif line.strip().startswith("http"):
-                    details.homepage = line.strip()
-                    break
-
-            return details
-        except subprocess.CalledProcessError:
+            return PackageDetails(
+                name=formula["name"],
+                version=version,
+                summary=formula.get("desc") or "",
+                homepage=formula.get("homepage") or "",
+                license=formula.get("license") or "",
+                requires=formula.get("dependencies") or [],
+            )
+        except (
+            subprocess.CalledProcessError,
+            ValueError,
+            KeyError,
+            IndexError,
+            TypeError,
+            AttributeError,
+        ):
             return None
 
     def update(self, packages: Optional[list[str]] = None, dry_run: bool = False) -> CommandResult:
@@ -594,9 +923,10 @@ class CaskManager(PackageManager):
     name = "cask"
     color = "bright_blue"
     tool = "brew"
+    max_workers = 1
 
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        return self._run_command(["brew", "install", "--cask", *packages], dry_run)
+        return self._run_batch(["brew", "install", "--cask"], packages, dry_run)
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
         return self._run_command(["brew", "uninstall", "--cask", *packages], dry_run)
@@ -604,17 +934,9 @@ class CaskManager(PackageManager):
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get installed brew casks"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "brew list --cask --versions"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
             packages = []
-            for line in result.stdout.splitlines():
-                parts = line.strip().split()
+            for line in self._query_lines(["brew", "list", "--cask", "--versions"]):
+                parts = line.split()
                 if len(parts) >= 2:
                     name = parts[0]
                     version = parts[-1]
@@ -624,41 +946,24 @@ class CaskManager(PackageManager):
             return []
 
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
-        """Get detailed info about a cask"""
+        """Get detailed info about a cask from `brew info --json=v2`"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", f"brew info --cask {name}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
+            result = self._query(["brew", "info", "--json=v2", "--cask", name])
+            cask = json.loads(result.stdout)["casks"][0]
+            return PackageDetails(
+                name=cask["token"],
+                version=cask.get("installed") or cask.get("version") or "unknown",
+                summary=cask.get("desc") or "",
+                homepage=cask.get("homepage") or "",
             )
-            lines = result.stdout.splitlines()
-            if not lines:
-                return None
-
-            first_line = lines[0]
-            match = re.match(r"^==> (\S+): (.+)$", first_line)
-            if match:
-                pkg_name, version = match.group(1), match.group(2).strip()
-            else:
-                pkg_name = name
-                version = "unknown"
-
-            details = PackageDetails(name=pkg_name, version=version)
-
-            for line in lines[1:]:
-                if line.startswith("==>"):
-                    continue
-                if not details.summary and line.strip() and not line.startswith("http"):
-                    details.summary = line.strip()
-                elif line.strip().startswith("http"):
-                    details.homepage = line.strip()
-                    break
-
-            return details
-        except subprocess.CalledProcessError:
+        except (
+            subprocess.CalledProcessError,
+            ValueError,
+            KeyError,
+            IndexError,
+            TypeError,
+            AttributeError,
+        ):
             return None
 
     def update(self, packages: Optional[list[str]] = None, dry_run: bool = False) -> CommandResult:
@@ -676,13 +981,10 @@ class MasManager(PackageManager):
     install_cmds = {
         "darwin": ["brew", "install", "mas"],
     }
+    max_workers = 1
 
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        for app_id in packages:
-            result = self._run_command(["mas", "install", str(app_id)], dry_run)
-            if not result.success:
-                return result
-        return CommandResult(success=True)
+        return self._run_batch(["mas", "install"], [str(app_id) for app_id in packages], dry_run)
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
         console.print(
@@ -693,17 +995,9 @@ class MasManager(PackageManager):
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get installed Mac App Store apps"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "mas list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
             packages = []
-            for line in result.stdout.splitlines():
-                match = re.match(r"^(\d+)\s+(.+?)\s+\(([^)]+)\)$", line.strip())
+            for line in self._query_lines(["mas", "list"]):
+                match = _MAS_APP_RE.fullmatch(line.strip())
                 if match:
                     app_id, app_name, version = match.groups()
                     packages.append(
@@ -720,16 +1014,8 @@ class MasManager(PackageManager):
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
         """Get details about a Mac App Store app (by ID)"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "mas list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
-            for line in result.stdout.splitlines():
-                match = re.match(r"^(\d+)\s+(.+?)\s+\(([^)]+)\)$", line.strip())
+            for line in self._query_lines(["mas", "list"]):
+                match = _MAS_APP_RE.fullmatch(line.strip())
                 if match:
                     app_id, app_name, version = match.groups()
                     if app_id == name:
@@ -755,54 +1041,36 @@ class WingetManager(PackageManager):
     color = "cyan"
     tool = "winget.exe"
 
+    # winget takes one --id per call, but calls must not overlap: installers
+    # share the terminal (UAC prompts, progress) and concurrent MSI installs
+    # fail with 1618
+    max_workers = 1
+
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        results = []
-        for pkg in packages:
-            pkg_escaped = shlex.quote(pkg)
-            results.append(
-                self._run_command(
-                    [
-                        "winget.exe",
-                        "install",
-                        pkg_escaped,
-                        "--silent",
-                        "--accept-package-agreements",
-                        "--accept-source-agreements",
-                    ],
-                    dry_run,
-                )
-            )
-        return CommandResult(success=all(r.success for r in results))
+        return self._run_each(
+            [
+                "winget.exe",
+                "install",
+                "--silent",
+                "--accept-package-agreements",
+                "--accept-source-agreements",
+            ],
+            packages,
+            dry_run,
+        )
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        results = []
-        for pkg in packages:
-            pkg_escaped = shlex.quote(pkg)
-            results.append(
-                self._run_command(
-                    ["winget.exe", "uninstall", pkg_escaped],
-                    dry_run,
-                )
-            )
-        return CommandResult(success=all(r.success for r in results))
+        return self._run_each(["winget.exe", "uninstall"], packages, dry_run)
 
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get installed winget packages (Name/Id/Version)"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "winget.exe list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
             packages = []
-            for line in result.stdout.splitlines():
+            for line in self._query_lines(["winget.exe", "list"]):
                 line = line.strip()
                 if not line or line.startswith("Name") or line.startswith("---"):
                     continue
-                parts = re.split(r"\s{2,}", line)
+                parts = _COLUMN_GAP_RE.split(line)
                 if len(parts) >= 3:
                     name, pkg_id, version = parts[0], parts[1], parts[2]
                     packages.append(PackageInfo(name=pkg_id, version=version, display_name=name))
@@ -810,42 +1078,32 @@ class WingetManager(PackageManager):
         except subprocess.CalledProcessError:
             return []
 
+    def has_package(self, name: str) -> bool:
+        # Ids and display names are matched case-insensitively, as in the CLI
+        wanted = name.lower()
+        return any(
+            p.name.lower() == wanted or p.display_name.lower() == wanted
+            for p in self.installed_snapshot()
+        )
+
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
         """Get detailed info about a winget package"""
         try:
-            shell = detect_shell()
-            name_escaped = shlex.quote(name)
-            result = subprocess.run(
-                [shell, "-l", "-c", f"winget.exe show {name_escaped}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
+            result = self._query(["winget.exe", "show", name])
+            fields = _parse_fields(result.stdout, {"version", "homepage", "description", "license"})
+            return PackageDetails(
+                name=name,
+                version=fields.get("version", "unknown"),
+                summary=fields.get("description", ""),
+                homepage=fields.get("homepage", ""),
+                license=fields.get("license", ""),
             )
-            details = PackageDetails(name=name, version="unknown")
-            for line in result.stdout.splitlines():
-                if ":" not in line:
-                    continue
-                key, value = (s.strip() for s in line.split(":", 1))
-                if key == "Version":
-                    details.version = value
-                elif key == "Homepage":
-                    details.homepage = value
-                elif key == "Description" and not details.summary:
-                    details.summary = value
-                elif key == "License":
-                    details.license = value
-            return details
         except subprocess.CalledProcessError:
             return None
 
     def update(self, packages: Optional[list[str]] = None, dry_run: bool = False) -> CommandResult:
         if packages:
-            results = []
-            for pkg in packages:
-                pkg_escaped = shlex.quote(pkg)
-                results.append(self._run_command(["winget.exe", "upgrade", pkg_escaped], dry_run))
-            return CommandResult(success=all(r.success for r in results))
+            return self._run_each(["winget.exe", "upgrade"], packages, dry_run)
         return self._run_command(["winget.exe", "upgrade", "--all"], dry_run)
 
 
@@ -859,37 +1117,34 @@ class BunManager(PackageManager):
         "darwin": ["brew", "install", "oven-sh/bun/bun"],
         "linux": ["sh", "-c", "curl -fsSL https://bun.sh/install | bash"],
     }
+    # Every global add/remove/update rewrites the same package.json and lockfile
+    max_workers = 1
+
+    def _state_paths(self) -> list[Path]:
+        # Global packages are recorded in the global install's manifest and lockfile
+        bun_home = Path(os.environ.get("BUN_INSTALL") or Path.home() / ".bun")
+        global_dir = bun_home / "install" / "global"
+        return [global_dir / "package.json", *sorted(global_dir.glob("bun.lock*"))]
 
     def install(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        for pkg in packages:
-            result = self._run_command(["bun", "add", "-g", pkg], dry_run)
-            if not result.success:
-                return result
-        return CommandResult(success=True)
+        return self._run_batch(["bun", "add", "-g"], packages, dry_run)
 
     def remove(self, packages: list[str], dry_run: bool = False) -> CommandResult:
-        for pkg in packages:
-            result = self._run_command(["bun", "remove", "-g", pkg], dry_run)
-            if not result.success:
-                return result
-        return CommandResult(success=True)
+        return self._run_batch(["bun", "remove", "-g"], packages, dry_run)
 
     def get_installed_packages(self) -> list[PackageInfo]:
         """Get globally installed bun packages"""
         try:
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", "bun pm ls -g"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-                check=True,
-            )
             packages = []
-            for line in result.stdout.splitlines():
-                match = re.search(r"([^@\s├└─│]+)@([^\s\[]+)", line)
-                if match:
-                    packages.append(PackageInfo(name=match.group(1), version=match.group(2)))
+            for line in self._query_lines(["bun", "pm", "ls", "-g"]):
+                # "├── @scope/pkg@1.2.3": split at the last "@" after the tree glyphs
+                line = line.rstrip()
+                entry = line.lstrip(" │├└─")
+                if entry == line or "@" not in entry[1:]:
+                    continue
+                name, _, version = entry.rpartition("@")
+                version = version.split(" ", 1)[0].split("[", 1)[0]
+                packages.append(PackageInfo(name=name, version=version))
             return packages
         except subprocess.CalledProcessError:
             return []
@@ -897,33 +1152,20 @@ class BunManager(PackageManager):
     def get_package_details(self, name: str) -> Optional[PackageDetails]:
         """Get detailed info about a bun global package"""
         try:
-            packages = self.get_installed_packages()
+            packages = self.installed_snapshot()
             pkg_info = next((p for p in packages if p.name == name), None)
             if not pkg_info:
                 return None
 
-            shell = detect_shell()
-            result = subprocess.run(
-                [shell, "-l", "-c", f"bun pm info {name}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.DEVNULL,
-                text=True,
-            )
+            result = self._query(["bun", "pm", "info", name], check=False)
 
             details = PackageDetails(name=name, version=pkg_info.version)
 
             if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    if ":" not in line:
-                        continue
-                    key, value = (s.strip() for s in line.split(":", 1))
-                    key_lower = key.lower()
-                    if key_lower == "description" and not details.summary:
-                        details.summary = value
-                    elif key_lower == "homepage":
-                        details.homepage = value
-                    elif key_lower == "license":
-                        details.license = value
+                fields = _parse_fields(result.stdout, {"description", "homepage", "license"})
+                details.summary = fields.get("description", "")
+                details.homepage = fields.get("homepage", "")
+                details.license = fields.get("license", "")
 
             return details
         except Exception:
@@ -931,11 +1173,7 @@ class BunManager(PackageManager):
 
     def update(self, packages: Optional[list[str]] = None, dry_run: bool = False) -> CommandResult:
         if packages:
-            for pkg in packages:
-                result = self._run_command(["bun", "update", "-g", pkg], dry_run)
-                if not result.success:
-                    return result
-            return CommandResult(success=True)
+            return self._run_batch(["bun", "update", "-g"], packages, dry_run)
         return self._run_command(["bun", "update", "-g"], dry_run)
 
 
@@ -965,7 +1203,7 @@ class CustomManager:
 
         console.print(f"  [dim]Running in {shell}...[/]")
         try:
-            result = subprocess.run(
+            result = run_process(
                 [shell, "-l", "-c", script],
                 check=False,
                 capture_output=False,
@@ -981,7 +1219,7 @@ class CustomManager:
 
         shell = self._get_shell(pkg_config)
         try:
-            result = subprocess.run(
+            result = run_process(
                 [shell, "-l", "-c", pkg_config.check],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
@@ -991,6 +1229,62 @@ class CustomManager:
         except Exception:
             return False
 
+    def check_installed(self, pkg_configs: list[CustomPackageConfig]) -> list[bool]:
+        """
+        Run the check scripts for several packages, reporting results in order.
+
+        Checks that share a POSIX shell run as one script in one login shell,
+        so the profile is sourced once rather than once per package. Checks
+        for other shells (fish, tcsh), and any batch whose output cannot be
+        matched up, run one process each, concurrently.
+        """
+        results = [False] * len(pkg_configs)
+        by_shell: dict[str, list[int]] = {}
+        for i, pkg_config in enumerate(pkg_configs):
+            if pkg_config.check:
+                by_shell.setdefault(self._get_shell(pkg_config), []).append(i)
+
+        single = []
+        for shell, indices in by_shell.items():
+            statuses = None
+            if len(indices) > 1 and Path(shell).name in _POSIX_SHELLS:
+                statuses = self._run_checks(shell, [pkg_configs[i].check for i in indices])
+            if statuses is None:
+                single.extend(indices)
+            else:
+                for i, status in zip(indices, statuses):
+                    results[i] = status
+        installed = run_parallel(lambda i: self.is_installed(pkg_configs[i]), single)
+        for i, status in zip(single, installed):
+            results[i] = status
+        return results
+
+    def _run_checks(self, shell: str, checks: list[str]) -> Optional[list[bool]]:
+        """Run several check scripts in one login shell; None if that fails"""
+        # A subshell per check keeps `exit` and `cd` from leaking into the next
+        script = "".join(
+            f"(\n{check}\n) </dev/null >/dev/null 2>&1; echo {_CHECK_MARKER} $?\n"
+            for check in checks
+        )
+        try:
+            result = run_process(
+                [shell, "-l", "-c", script],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                check=False,
+            )
+        except OSError:
+            return None
+        # The profile may print too; only marker lines are ours
+        statuses = [
+            line.split()[-1] == "0"
+            for line in result.stdout.splitlines()
+            if line.startswith(_CHECK_MARKER)
+        ]
+        return statuses if len(statuses) == len(checks) else None
+
     def install(self, pkg_config: CustomPackageConfig, dry_run: bool = False) -> CommandResult:
         """Install a custom package"""
         shell = self._get_shell(pkg_config)
@@ -1008,12 +1302,12 @@ class CustomManager:
 
     def get_installed_packages(self, custom_configs: dict[str, dict]) -> list[PackageInfo]:
         """Get list of installed custom packages"""
-        packages = []
-        for name, config in custom_configs.items():
-            pkg_config = self.parse_config(name, config)
-            if self.is_installed(pkg_config):
-                packages.append(PackageInfo(name=name, version="custom"))
-        return packages
+        pkg_configs = [self.parse_config(name, config) for name, config in custom_configs.items()]
+        return [
+            PackageInfo(name=pkg_config.name, version="custom")
+            for pkg_config, installed in zip(pkg_configs, self.check_installed(pkg_configs))
+            if installed
+        ]
 
     def get_package_details(self, name: str, config: dict) -> Optional[PackageDetails]:
         """Get details about a custom package"""
@@ -1041,18 +1335,33 @@ class CustomManager:
             check=config.get("check", ""),
             remove=config.get("remove", ""),
             shell=config.get("shell", ""),
-            depends=config.get("depends", []),
+            depends=config.get("depends") or [],
             description=config.get("description", ""),
         )
 
 
+@functools.cache
 def load_specs() -> dict:
-    """Load custom package specs from the bundled specs.yaml"""
+    """Load custom package specs from the bundled specs.yaml (parsed once per process)
+
+    Like the manifest, the parsed specs are pickled under the cache dir and
+    reused while the file's path, mtime and size are unchanged, so commands
+    that only check whether a name is a custom package never import yaml.
+    """
+    from importlib import resources
+
     try:
         specs_file = resources.files("onepkg").joinpath("specs.yaml")
         with resources.as_file(specs_file) as path:
-            with open(path) as f:
-                return yaml.safe_load(f) or {}
+            st = path.stat()
+            key = (str(path), st.st_mtime_ns, st.st_size)
+            cache_path = get_cache_dir() / "specs.pkl"
+            specs = read_cache(cache_path, key)
+            if specs is None:
+                with open(path) as f:
+                    specs = load_yaml(f) or {}
+                write_cache(cache_path, key, specs)
+            return specs
     except Exception:
         return {}
 
@@ -1070,6 +1379,18 @@ MANAGERS: dict[str, PackageManager] = {
     "bun": BunManager(),
 }
 
+
+def warmup_managers(pkg_types: Iterable[str]) -> None:
+    """
+    Take the installed listing of each named manager concurrently.
+
+    Listings are independent subprocess waits, so a command showing several
+    managers waits for the slowest one instead of the sum of all of them.
+    """
+    managers = [MANAGERS[t] for t in dict.fromkeys(pkg_types) if t in MANAGERS]
+    run_parallel(lambda manager: manager.warmup(), managers, len(managers))
+
+
 # Custom manager instance (separate since it has different interface)
 CUSTOM_MANAGER = CustomManager()
 
@@ -1,14 +1,29 @@
 """Manifest file handling for onepkg."""
 
+import functools
+import hashlib
 import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-import yaml
-
 from .managers import CATEGORIES, CATEGORY_ORDER, MANAGERS
-from .utils import console, is_macos, is_wsl
+from .utils import (
+    console,
+    dump_yaml,
+    get_cache_dir,
+    is_macos,
+    is_wsl,
+    load_yaml,
+    platform_matches,
+    read_cache,
+    write_cache,
+)
+
+# Package type -> category (each type belongs to exactly one category)
+_TYPE_TO_CATEGORY = {
+    pkg_type: cat_name for cat_name, cat in CATEGORIES.items() for pkg_type in cat["types"]
+}
 
 
 def get_default_manifest_path() -> Path:
@@ -19,6 +34,16 @@ def get_default_manifest_path() -> Path:
     return Path.home() / ".config" / "packages.yaml"
 
 
+def find_manifest(env: Optional[str] = None) -> Path:
+    """Locate the manifest file without parsing it; exit if it is missing"""
+    path = Path(env).expanduser() if env else get_default_manifest_path()
+    if not path.exists():
+        console.print(f"[red]Error:[/] Manifest file not found: {path}")
+        console.print("[dim]Create one with your package definitions[/]")
+        raise SystemExit(1)
+    return path
+
+
 def load_manifest(env: Optional[str] = None) -> tuple[dict, dict, Path]:
     """
     Load the package manifest file.
@@ -29,18 +54,8 @@ def load_manifest(env: Optional[str] = None) -> tuple[dict, dict, Path]:
         - raw_data: original nested structure for round-trip saving
         - path: path to the manifest file
     """
-    if env:
-        path = Path(env).expanduser()
-    else:
-        path = get_default_manifest_path()
-
-    if not path.exists():
-        console.print(f"[red]Error:[/] Manifest file not found: {path}")
-        console.print("[dim]Create one with your package definitions[/]")
-        raise SystemExit(1)
-
-    with open(path) as f:
-        raw_data = yaml.safe_load(f) or {}
+    path = find_manifest(env)
+    raw_data = read_raw_manifest(path)
 
     # Flatten nested structure based on platform
     data = flatten_manifest(raw_data)
@@ -48,10 +63,39 @@ def load_manifest(env: Optional[str] = None) -> tuple[dict, dict, Path]:
     return data, raw_data, path
 
 
+def _manifest_cache_path(path: Path) -> Path:
+    """Get the parse-cache file for a manifest path"""
+    digest = hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:16]
+    return get_cache_dir() / f"manifest-{digest}.pkl"
+
+
+def read_raw_manifest(path: Path) -> dict:
+    """
+    Parse a manifest file, reusing a pickled copy while the file is unchanged.
+
+    The cache is keyed on the file's st_mtime_ns and size, so any edit
+    (including save_manifest, or one landing within the filesystem's
+    timestamp granularity) forces a fresh YAML parse.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cache_path = _manifest_cache_path(path)
+
+    raw_data = read_cache(cache_path, key)
+    if raw_data is not None:
+        return raw_data
+
+    with open(path) as f:
+        raw_data = load_yaml(f) or {}
+
+    write_cache(cache_path, key, raw_data)
+    return raw_data
+
+
 def save_manifest(data: dict, path: Path):
     """Save manifest data to file"""
     with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        dump_yaml(data, f)
 
 
 def flatten_manifest(raw_data: dict) -> dict:
@@ -68,30 +112,29 @@ def flatten_manifest(raw_data: dict) -> dict:
         brew: [...]
         python: [...]
 
-    Only includes packages for the current platform.
+    Only includes packages for the current platform. Every value in the
+    result is a non-empty list; malformed sections are dropped here so
+    callers only need data.get(pkg_type, []).
     """
     flattened = {}
-    active_categories = get_active_categories()
-
-    for cat_name in active_categories:
-        # Check if this category has a section in raw_data
-        if cat_name in raw_data:
-            section = raw_data[cat_name]
-            if isinstance(section, dict):
-                for pkg_type, packages in section.items():
-                    if packages:
-                        # Filter by platform constraints in package entries
-                        filtered = filter_packages_by_platform(packages)
-                        if filtered:
-                            flattened[pkg_type] = filtered
+    for cat_name in get_active_categories():
+        section = raw_data.get(cat_name)
+        if not isinstance(section, dict):
+            continue
+        for pkg_type, packages in section.items():
+            if not isinstance(packages, list):
+                continue
+            # Filter by platform constraints in package entries
+            filtered = filter_packages_by_platform(packages)
+            if filtered:
+                flattened[pkg_type] = filtered
 
     # Handle custom packages at top level
-    if "custom" in raw_data:
-        custom_list = raw_data["custom"]
-        if isinstance(custom_list, list):
-            filtered = filter_packages_by_platform(custom_list)
-            if filtered:
-                flattened["custom"] = filtered
+    custom_list = raw_data.get("custom")
+    if isinstance(custom_list, list):
+        filtered = filter_packages_by_platform(custom_list)
+        if filtered:
+            flattened["custom"] = filtered
 
     return flattened
 
@@ -100,26 +143,20 @@ def filter_packages_by_platform(packages: list) -> list:
     """Filter package list by platform constraints"""
     filtered = []
     for entry in packages:
-        if isinstance(entry, dict):
-            # Check for platform constraint
-            platform = entry.get("platform") or entry.get("platforms")
-            if platform:
-                from .utils import platform_matches
-
-                if not platform_matches(platform):
-                    continue
+        if not isinstance(entry, dict):
+            # Simple string entry
+            filtered.append(entry)
+        elif platform_matches(entry.get("platform") or entry.get("platforms")):
             # Extract name for the flattened list
             name = entry.get("name")
             if name:
                 filtered.append(name)
-        else:
-            # Simple string entry
-            filtered.append(entry)
     return filtered
 
 
-def get_active_categories() -> list[str]:
-    """Get list of active category names for current platform"""
+@functools.cache
+def get_active_categories() -> tuple[str, ...]:
+    """Get the active category names for the current platform (fixed for the run)"""
     active = []
     for cat_name in CATEGORY_ORDER:
         cat = CATEGORIES[cat_name]
@@ -134,18 +171,25 @@ def get_active_categories() -> list[str]:
         elif platform == "linux" and sys.platform == "linux":
             active.append(cat_name)
 
-    return active
+    return tuple(active)
+
+
+@functools.cache
+def get_active_types() -> frozenset[str]:
+    """Package types belonging to the active categories"""
+    return frozenset(
+        pkg_type
+        for cat_name in get_active_categories()
+        for pkg_type in CATEGORIES[cat_name]["types"]
+    )
 
 
 def get_category_for_type(pkg_type: str) -> Optional[str]:
     """Get the category name for a package type"""
-    for cat_name, cat in CATEGORIES.items():
-        if pkg_type in cat["types"]:
-            return cat_name
-    return None
+    return _TYPE_TO_CATEGORY.get(pkg_type)
 
 
-def update_raw_manifest(raw_data: dict, pkg_type: str, name: str, action: str):
+def update_raw_manifest(raw_data: dict, pkg_type: str, name: str, action: str) -> bool:
     """
     Update the raw manifest data structure.
 
@@ -154,17 +198,15 @@ def update_raw_manifest(raw_data: dict, pkg_type: str, name: str, action: str):
         pkg_type: Package type (brew, python, etc.)
         name: Package name
         action: "add" or "remove"
+
+    Returns:
+        True if an entry was added or removed, i.e. the manifest needs saving
     """
     if pkg_type == "custom":
         # Custom packages are at the top level
         if "custom" not in raw_data:
             raw_data["custom"] = []
-        if action == "add":
-            if name not in raw_data["custom"]:
-                raw_data["custom"].append(name)
-        elif action == "remove":
-            if name in raw_data["custom"]:
-                raw_data["custom"].remove(name)
+        entries = raw_data["custom"]
     else:
         # Find the category for this type
         category = get_category_for_type(pkg_type)
@@ -176,20 +218,31 @@ def update_raw_manifest(raw_data: dict, pkg_type: str, name: str, action: str):
             raw_data[category] = {}
         if pkg_type not in raw_data[category]:
             raw_data[category][pkg_type] = []
+        entries = raw_data[category][pkg_type]
+
+    index = _find_entry(entries, name)
+    if action == "add" and index is None:
+        entries.append(name)
+        return True
+    if action == "remove" and index is not None:
+        del entries[index]
+        return True
+    return False
 
-        if action == "add":
-            if name not in raw_data[category][pkg_type]:
-                raw_data[category][pkg_type].append(name)
-        elif action == "remove":
-            # Handle both simple names and dict entries
-            pkg_list = raw_data[category][pkg_type]
-            for i, entry in enumerate(pkg_list):
-                entry_name = entry.get("name") if isinstance(entry, dict) else entry
-                if entry_name == name:
-                    pkg_list.pop(i)
-                    break
+
+def _find_entry(entries: list, name: str) -> Optional[int]:
+    """Index of the first entry for name, whether a plain string or a {"name": ...} dict"""
+    try:
+        # Plain string entries are the common case; list.index scans in C
+        return entries.index(name)
+    except ValueError:
+        for i, entry in enumerate(entries):
+            if isinstance(entry, dict) and entry.get("name") == name:
+                return i
+    return None
 
 
+@functools.cache
 def parse_package_entry(entry: str) -> tuple[str, Optional[str]]:
     """
     Parse a package entry that may have fallback syntax.
@@ -222,6 +275,9 @@ def parse_custom_entry(entry) -> tuple[Optional[str], Optional[object]]:
 
 def package_in_list(name: str, pkg_list: list) -> bool:
     """Check if a package name is in the list (handling fallback syntax)"""
+    # Exact plain entries are the common case; the membership test scans in C
+    if name in pkg_list:
+        return True
     for entry in pkg_list:
         if isinstance(entry, str):
             entry_name, _ = parse_package_entry(entry)
@@ -265,21 +321,15 @@ def resolve_package_manager(
     if not preferred_manager:
         return default_manager
 
-    # Check if preferred manager exists and is available
+    # The preferred manager must exist, be active on this platform and be installed
     manager = MANAGERS.get(preferred_manager)
-    if not manager:
+    if not manager or preferred_manager not in get_active_types():
         return default_manager
 
     if not manager.is_available():
         return default_manager
 
-    # Check if this manager type is active on current platform
-    active_cats = get_active_categories()
-    for cat_name in active_cats:
-        if preferred_manager in CATEGORIES[cat_name]["types"]:
-            return preferred_manager
-
-    return default_manager
+    return preferred_manager
 
 
 def resolve_all_packages(data: dict) -> dict:
@@ -289,11 +339,19 @@ def resolve_all_packages(data: dict) -> dict:
     For example, if "tmux:brew" is under conda, on macOS it moves to brew,
     on Linux it stays under conda.
     """
-    resolved = {}
+    # Ordered dicts as sets: dedup in O(1) while keeping manifest order
+    resolved: dict[str, dict] = {}
+    custom = None
 
     for pkg_type, packages in data.items():
         if pkg_type == "custom":
-            resolved["custom"] = packages
+            custom = packages
+            continue
+
+        target = resolved.setdefault(pkg_type, {})
+        if all(isinstance(entry, str) and ":" not in entry for entry in packages):
+            # No fallback syntax or dict entries in this type: nothing moves
+            target.update(dict.fromkeys(packages))
             continue
 
         for entry in packages:
@@ -302,15 +360,17 @@ def resolve_all_packages(data: dict) -> dict:
                 target_manager = resolve_package_manager(pkg_name, preferred, pkg_type)
             else:
                 # Dict entry with platform constraint
-                pkg_name = entry.get("name", entry)
+                pkg_name = entry.get("name")
+                if not pkg_name:
+                    continue
                 target_manager = pkg_type
 
-            if target_manager not in resolved:
-                resolved[target_manager] = []
-            if pkg_name not in resolved[target_manager]:
-                resolved[target_manager].append(pkg_name)
+            resolved.setdefault(target_manager, {})[pkg_name] = None
 
-    return resolved
+    result = {pkg_type: [*names] for pkg_type, names in resolved.items() if names}
+    if custom is not None:
+        result["custom"] = custom
+    return result
 
 
 def find_custom_entry(raw_data: dict, name: str) -> Optional[object]:
@@ -340,5 +400,20 @@ def reorder_types(types: list[str]) -> list[str]:
 
 
 def get_installed_names(manager) -> set[str]:
-    """Get set of installed package names for a manager"""
-    return {p.name for p in manager.get_installed_packages()}
+    """
+    Get set of installed package names for a manager.
+
+    winget ids and display names are matched case-insensitively, so for winget
+    the set also holds every id and display name in lowercase.
+    """
+    packages = manager.installed_snapshot()
+    if manager.name != "winget":
+        return {p.name for p in packages}
+    names = set()
+    for p in packages:
+        names.add(p.name)
+        names.add(p.name.lower())
+        if p.display_name:
+            names.add(p.display_name)
+            names.add(p.display_name.lower())
+    return names
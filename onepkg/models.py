@@ -1,9 +1,9 @@
 """Data models for onepkg."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageInfo:
     """Information about an installed package"""
 
@@ -12,7 +12,7 @@ class PackageInfo:
     display_name: str = ""  # Optional display name (e.g., app name for mas)
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageDetails:
     """Detailed information about a package"""
 
@@ -22,17 +22,11 @@ class PackageDetails:
     homepage: str = ""
     license: str = ""
     location: str = ""
-    requires: list[str] = None
-    binaries: list[str] = None
+    requires: list[str] = field(default_factory=list)
+    binaries: list[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        if self.requires is None:
-            self.requires = []
-        if self.binaries is None:
-            self.binaries = []
 
-
-@dataclass
+@dataclass(slots=True)
 class CustomPackageConfig:
     """Configuration for a custom package"""
 
@@ -41,17 +35,13 @@ class CustomPackageConfig:
     check: str = ""  # Command to check if installed (exit 0 = installed)
     remove: str = ""  # Remove command/script
     shell: str = ""  # Shell to use (default: detect from parent)
-    depends: list[str] = None  # Dependencies (other packages)
+    depends: list[str] = field(default_factory=list)  # Dependencies (other packages)
     description: str = ""  # Optional description
 
-    def __post_init__(self):
-        if self.depends is None:
-            self.depends = []
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandResult:
-    """Result of a command execution"""
+    """Result of a command execution (immutable once returned)"""
 
     success: bool
     message: str = ""
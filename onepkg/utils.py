@@ -1,24 +1,196 @@
 """Utility functions for onepkg."""
 
+import functools
 import os
+import pickle
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
 
-from rich.console import Console
 
-console = Console()
+@functools.cache
+def get_console():
+    """Get the shared rich Console, importing rich on first use"""
+    from rich.console import Console
 
+    return Console()
 
+
+class _LazyConsole:
+    """Stand-in for the shared Console that defers importing rich until used"""
+
+    def __getattr__(self, name: str):
+        return getattr(get_console(), name)
+
+
+console = _LazyConsole()
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def load_yaml(stream) -> object:
+    """Parse YAML, using LibYAML's CSafeLoader when PyYAML was built with it.
+
+    yaml is imported here rather than at module level since commands served
+    from the manifest cache never need it.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+def has_libyaml() -> bool:
+    """Whether load_yaml/dump_yaml get LibYAML's C classes rather than the pure-Python ones"""
+    import yaml
+
+    return hasattr(yaml, "CSafeLoader")
+
+
+def dump_yaml(data: object, stream=None) -> Optional[str]:
+    """Serialize YAML in block style and key order, with LibYAML's CSafeDumper if available.
+
+    Returns the text when no stream is given, like yaml.dump.
+    """
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    return yaml.dump(data, stream, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+
+@functools.cache
+def _which(name: str, path: str) -> Optional[str]:
+    return shutil.which(name, path=path)
+
+
+def which(name: str, path: Optional[str] = None) -> Optional[str]:
+    """
+    Cached shutil.which.
+
+    A lookup stats every PATH entry, and the same manager binaries are
+    resolved over and over in one run. The cache is keyed on the searched
+    PATH (the current one by default) so changes to it are still honored;
+    call which.cache_clear() to forget binaries installed mid-run.
+    """
+    return _which(name, path if path is not None else os.environ.get("PATH", os.defpath))
+
+
+which.cache_clear = _which.cache_clear
+
+
+def run_process(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """
+    Run a command with subprocess.run, keeping CPython's posix_spawn path.
+
+    subprocess launches children with posix_spawn() instead of fork()+exec()
+    only when the executable is a path, close_fds is False, and no
+    preexec_fn, cwd, pass_fds, session/process-group or user/group options
+    are given; posix_spawn avoids copying the parent's page tables. Our own
+    descriptors are non-inheritable (PEP 446), so close_fds=False leaks nothing.
+    """
+    executable = which(cmd[0]) or cmd[0]
+    return subprocess.run(cmd, executable=executable, close_fds=False, **kwargs)
+
+
+def stream_lines(cmd: list[str]) -> Iterator[str]:
+    """
+    Yield a command's stdout line by line while it is still running.
+
+    Lets listing parsers work as output arrives instead of waiting for the
+    whole buffer. Raises CalledProcessError on a non-zero exit, like
+    run_process(..., check=True). A consumer that stops early (e.g. a
+    details lookup that found its package) terminates the command.
+    """
+    executable = which(cmd[0]) or cmd[0]
+    with subprocess.Popen(
+        cmd,
+        executable=executable,
+        close_fds=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as proc:
+        try:
+            yield from proc.stdout
+        except GeneratorExit:
+            proc.terminate()
+            raise
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def get_cache_dir() -> Path:
+    """Get the onepkg cache directory (respects XDG_CACHE_HOME)"""
+    env_path = os.environ.get("XDG_CACHE_HOME")
+    base = Path(env_path).expanduser() if env_path else Path.home() / ".cache"
+    return base / "onepkg"
+
+
+def read_cache(cache_path: Path, key: object) -> Optional[object]:
+    """Return the value pickled at cache_path if it was stored under key"""
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, value = pickle.load(f)
+    except Exception:
+        return None
+    return value if cached_key == key else None
+
+
+def write_cache(cache_path: Path, key: object, value: object) -> None:
+    """Pickle value under key; the cache is best-effort, so write errors are ignored
+
+    The pickle goes to a sibling temp file that is renamed into place, so a
+    concurrent onepkg run never reads a half-written cache.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _cache_once(func: Callable[[], R]) -> Callable[[], R]:
+    """
+    functools.cache for a zero-argument function, computed by one thread only.
+
+    functools.cache lets concurrent first calls each run the function; for
+    the shell probes below that would mean one login shell per warmup thread.
+    """
+    cached = functools.cache(func)
+    lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper() -> R:
+        with lock:
+            return cached()
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+# Parent process names detect_shell accepts as the user's shell
+_SHELL_NAMES = frozenset({"bash", "zsh", "fish", "sh", "ksh", "tcsh"})
+
+
+@_cache_once
 def detect_shell() -> str:
-    """Detect the current shell from parent process"""
+    """Detect the current shell from parent process (once; it cannot change mid-run)"""
     env_shell = os.environ.get("SHELL")
     if env_shell and Path(env_shell).is_file():
         return env_shell
 
-    result = subprocess.run(
+    result = run_process(
         ["ps", "-p", str(os.getppid()), "-o", "comm="],
         stdout=subprocess.PIPE,
         text=True,
@@ -26,24 +198,49 @@ def detect_shell() -> str:
     )
     candidate = result.stdout.strip()
     if candidate:
-        candidate_path = shutil.which(candidate) or (
-            candidate if Path(candidate).is_file() else None
-        )
+        candidate_path = which(candidate) or (candidate if Path(candidate).is_file() else None)
         if candidate_path:
             shell_name = Path(candidate_path).name
-            if shell_name in {"bash", "zsh", "fish", "sh", "ksh", "tcsh"}:
+            if shell_name in _SHELL_NAMES:
                 return candidate_path
 
     return "/bin/bash" if Path("/bin/bash").is_file() else "sh"
 
 
+@_cache_once
+def login_path() -> str:
+    """
+    PATH as set up by the user's login shell, or "" if it cannot be read.
+
+    Sourcing the profile costs a noticeable fraction of a second, so it is
+    done once per run; tools found on this PATH can then be exec'd directly.
+    `env` prints PATH colon-separated whatever the shell's own syntax is.
+    """
+    try:
+        result = run_process(
+            [detect_shell(), "-l", "-c", "env"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    for line in result.stdout.splitlines():
+        if line.startswith("PATH="):
+            return line[5:]
+    return ""
+
+
 def is_macos() -> bool:
     """Check if running on macOS"""
     return sys.platform == "darwin"
 
 
+@functools.cache
 def is_wsl() -> bool:
-    """Check if running under WSL"""
+    """Check if running under WSL (once; reads /proc/version)"""
     if sys.platform != "linux":
         return False
     if os.environ.get("WSL_DISTRO_NAME"):
@@ -55,24 +252,63 @@ def is_wsl() -> bool:
         return False
 
 
+@functools.cache
+def platform_tags() -> frozenset[str]:
+    """Manifest platform tags that match this machine (sys.platform plus aliases)"""
+    tags = {sys.platform}
+    if sys.platform == "win32":
+        tags.add("windows")
+    if is_wsl():
+        tags.add("wsl")
+    return frozenset(tags)
+
+
 def platform_matches(platforms: Optional[object]) -> bool:
     """Check if current platform matches any of the provided platform tags."""
     if not platforms:
         return True
     if isinstance(platforms, str):
-        platforms = [platforms]
-    for platform in platforms:
-        if platform == "wsl" and is_wsl():
-            return True
-        if platform == "darwin" and is_macos():
-            return True
-        if platform == "linux" and sys.platform == "linux":
-            return True
-        if platform in {"windows", "win32"} and sys.platform == "win32":
-            return True
-        if platform == sys.platform:
-            return True
-    return False
+        return platforms in platform_tags()
+    return not platform_tags().isdisjoint(platforms)
+
+
+def run_parallel(func: Callable[[T], R], items: Iterable[T], max_workers: int = 8) -> list[R]:
+    """Run func over items concurrently, returning results in submission order.
+
+    Intended for subprocess-bound work: threads spend their time waiting on
+    child processes, so the GIL is not a bottleneck.
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def first_hit(
+    func: Callable[[T], Optional[R]], items: Iterable[T], max_workers: int = 8
+) -> Optional[tuple[T, R]]:
+    """Run func over items concurrently; return the first item (in order) with a truthy result.
+
+    Results are taken in item order as soon as each is ready, so a hit does
+    not wait on later items. Once one is found, items not yet started are
+    cancelled and only those already running are waited for, so no probe is
+    cut off mid-command. Exceptions are raised when their item's turn comes,
+    as in a sequential loop.
+    """
+    items = list(items)
+    if not items:
+        return None
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+    try:
+        futures = [executor.submit(func, item) for item in items]
+        for item, future in zip(items, futures):
+            result = future.result()
+            if result:
+                return item, result
+        return None
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
 
 def print_header(
@@ -88,6 +324,13 @@ def print_header(
         console.print(f"\n[bold {color}]▶ {action.capitalize()}[/] [{color}]{pkg_type}[/]")
 
 
+def print_panel(message: str, style: str = ""):
+    """Print a message inside a bordered panel"""
+    from rich.panel import Panel
+
+    console.print(Panel(message, style=style))
+
+
 def print_success(message: str = "Done"):
     """Print a success message"""
     console.print(f"[green]✓[/] {message}")
@@ -0,0 +1,17 @@
+"""Shared pytest fixtures."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep onepkg's on-disk caches out of the real home directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture(autouse=True)
+def no_login_shell(monkeypatch):
+    """Don't source the real user's profile to look up tools."""
+    monkeypatch.setattr("onepkg.managers.login_path", MagicMock(return_value=""))
@@ -1,5 +1,10 @@
 """Tests for package manager classes."""
 
+import json
+import os
+import subprocess
+from dataclasses import FrozenInstanceError
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -14,11 +19,15 @@ from onepkg.managers import (
     CaskManager,
     PythonManager,
     RustManager,
+    GoManager,
     CondaManager,
     BunManager,
+    WingetManager,
     CustomManager,
     MANAGERS,
     MANAGER_ORDER,
+    load_specs,
+    warmup_managers,
 )
 
 
@@ -80,6 +89,12 @@ class TestCommandResult:
         assert result.success is False
         assert result.message == "Package not found"
 
+    def test_result_is_immutable(self):
+        """Results cannot be altered after a command returns them."""
+        result = CommandResult(success=True)
+        with pytest.raises(FrozenInstanceError):
+            result.success = False
+
 
 class TestManagerRegistry:
     """Tests for the manager registry."""
@@ -95,6 +110,16 @@ class TestManagerRegistry:
             assert manager_type in MANAGER_ORDER
         assert "custom" in MANAGER_ORDER
 
+    def test_warmup_managers_skips_unknown_and_duplicate_types(self):
+        """Each named manager is warmed once; unknown types are ignored."""
+        with (
+            patch.object(MANAGERS["brew"], "warmup") as brew,
+            patch.object(MANAGERS["python"], "warmup") as python,
+        ):
+            warmup_managers(["brew", "python", "brew", "custom", "nope"])
+        brew.assert_called_once_with()
+        python.assert_called_once_with()
+
 
 class TestBrewManager:
     """Tests for BrewManager."""
@@ -120,6 +145,179 @@ class TestBrewManager:
         manager = BrewManager()
         assert manager.is_available() is False
 
+    def test_install_batches_packages(self):
+        """All packages go to a single brew invocation."""
+        manager = BrewManager()
+        with patch.object(manager, "_run_command", return_value=CommandResult(success=True)) as run:
+            result = manager.install(["ripgrep", "fzf"])
+        assert result.success is True
+        run.assert_called_once_with(["brew", "install", "ripgrep", "fzf"], False)
+
+    def test_install_falls_back_per_package(self):
+        """A failed batch is retried one package at a time."""
+        manager = BrewManager()
+
+        def fake_run(cmd, dry_run=False):
+            return CommandResult(success="bad" not in cmd)
+
+        with patch.object(manager, "_run_command", side_effect=fake_run) as run:
+            result = manager.install(["ripgrep", "bad", "fzf"])
+        assert result.success is False
+        assert "bad" in result.message
+        assert run.call_count == 4
+
+    def test_brew_info_reads_json(self):
+        """Formula details come from brew's JSON, preferring the installed version."""
+        payload = {
+            "formulae": [
+                {
+                    "name": "fzf",
+                    "desc": "Command-line fuzzy finder",
+                    "homepage": "https://github.com/junegunn/fzf",
+                    "license": "MIT",
+                    "dependencies": [],
+                    "versions": {"stable": "0.49.0"},
+                    "installed": [{"version": "0.48.1"}],
+                }
+            ],
+            "casks": [],
+        }
+        manager = BrewManager()
+        with patch.object(manager, "_query", return_value=MagicMock(stdout=json.dumps(payload))):
+            details = manager._brew_info("fzf")
+        assert (details.name, details.version, details.license) == ("fzf", "0.48.1", "MIT")
+        assert details.summary == "Command-line fuzzy finder"
+
+    def test_brew_info_without_stable_version(self):
+        """A HEAD-only formula, or one missing keys, gives no details instead of crashing."""
+        manager = BrewManager()
+        for formula in (
+            {"name": "tool", "installed": [], "versions": {"stable": None, "head": "HEAD"}},
+            {"name": "tool", "installed": []},
+            {"installed": [{"version": "1.0"}]},
+        ):
+            payload = json.dumps({"formulae": [formula]})
+            with patch.object(manager, "_query", return_value=MagicMock(stdout=payload)):
+                assert manager._brew_info("tool") is None
+
+    def test_cask_details_with_malformed_entry(self):
+        """A cask entry without a token, or not a mapping, gives no details."""
+        manager = CaskManager()
+        for cask in ({"version": "1.0"}, ["firefox"]):
+            payload = json.dumps({"casks": [cask]})
+            with patch.object(manager, "_query", return_value=MagicMock(stdout=payload)):
+                assert manager.get_package_details("firefox") is None
+
+    def test_package_details_cached_while_keg_unchanged(self, tmp_path, monkeypatch):
+        """brew info runs once per keg state."""
+        keg = tmp_path / "Cellar" / "fzf"
+        keg.mkdir(parents=True)
+        monkeypatch.setenv("HOMEBREW_CELLAR", str(tmp_path / "Cellar"))
+        manager = BrewManager()
+        details = PackageDetails(name="fzf", version="0.48.1")
+        with patch.object(manager, "_brew_info", return_value=details) as info:
+            assert manager.get_package_details("fzf") == details
+            assert manager.get_package_details("fzf") == details
+            assert info.call_count == 1
+
+            os.utime(keg, ns=(0, 1))
+            manager.get_package_details("fzf")
+            assert info.call_count == 2
+
+    def test_package_details_cache_keeps_tap_names_apart(self, tmp_path, monkeypatch):
+        """A tap-qualified name never reads another formula's cached details."""
+        cellar = tmp_path / "Cellar"
+        for keg in ("fzf", "x--fzf"):
+            (cellar / keg).mkdir(parents=True)
+            os.utime(cellar / keg, ns=(0, 1))
+        monkeypatch.setenv("HOMEBREW_CELLAR", str(cellar))
+        manager = BrewManager()
+
+        def info(name):
+            return PackageDetails(name=name, version="1.0")
+
+        with patch.object(manager, "_brew_info", side_effect=info):
+            manager.get_package_details("x/fzf")
+            assert manager.get_package_details("x--fzf").name == "x--fzf"
+
+    def test_has_package_checks_cellar_without_listing(self, tmp_path, monkeypatch):
+        """A formula counts as installed when its keg exists; brew is not run."""
+        (tmp_path / "fzf").mkdir()
+        monkeypatch.setenv("HOMEBREW_CELLAR", str(tmp_path))
+        manager = BrewManager()
+        with patch.object(manager, "get_installed_packages") as get:
+            assert manager.has_package("fzf")
+            assert manager.has_package("junegunn/tap/fzf")
+            assert not manager.has_package("ripgrep")
+        get.assert_not_called()
+
+    @patch("onepkg.managers.which", return_value="/opt/homebrew/bin/brew")
+    def test_query_execs_tool_directly(self, mock_which):
+        """Read-only queries skip the login shell when the tool is on PATH."""
+        argv = BrewManager()._argv(["brew", "info", "fzf"])
+        assert argv == ["/opt/homebrew/bin/brew", "info", "fzf"]
+
+    @patch("onepkg.managers.login_path", return_value="/login/bin")
+    def test_argv_resolves_against_login_path(self, mock_login_path):
+        """Tools only the login PATH knows about are still exec'd directly."""
+
+        def fake_which(name, path=None):
+            return f"{path}/{name}" if path else None
+
+        with patch("onepkg.managers.which", side_effect=fake_which):
+            argv = BrewManager()._argv(["brew", "info", "fzf"])
+        assert argv == ["/login/bin/brew", "info", "fzf"]
+
+    @patch("onepkg.managers.shutil.which", return_value=None)
+    @patch("onepkg.managers.detect_shell", return_value="/bin/zsh")
+    @patch("onepkg.managers.which", return_value=None)
+    def test_query_falls_back_to_login_shell(self, mock_which, mock_shell, mock_shutil_which):
+        """Tools only a login shell can find are run through one, quoted."""
+        argv = BrewManager()._argv(["brew", "info", "a b"])
+        assert argv == ["/bin/zsh", "-l", "-c", "brew info 'a b'"]
+
+    @patch("onepkg.managers.shutil.which", return_value="/opt/homebrew/bin/brew")
+    def test_argv_reuses_resolved_tool_path(self, mock_shutil_which):
+        """The manager's own tool is exec'd from the path is_available() found."""
+        manager = BrewManager()
+        assert manager.is_available()
+        with patch("onepkg.managers.which") as which:
+            assert manager._argv(["brew", "list"]) == ["/opt/homebrew/bin/brew", "list"]
+        which.assert_not_called()
+        mock_shutil_which.assert_called_once_with("brew")
+
+    @patch("onepkg.managers.which", return_value="/usr/bin/sh")
+    def test_run_command_passes_argv_unsplit(self, mock_which):
+        """Commands are exec'd as argv, so scripts and spaces survive intact."""
+        script = "curl -fsSL https://example.com/install.sh | bash"
+        with patch("onepkg.managers.run_process") as run:
+            run.return_value = subprocess.CompletedProcess([], 0)
+            result = BrewManager()._run_command(["sh", "-c", script])
+        assert result.success
+        assert run.call_args.args[0] == ["/usr/bin/sh", "-c", script]
+
+    def test_installed_snapshot_reused_until_command_runs(self):
+        """The listing is taken once and dropped when the manager runs a command."""
+        manager = BrewManager()
+        listing = [PackageInfo(name="fzf", version="0.48.1")]
+        with patch.object(manager, "get_installed_packages", return_value=listing) as get:
+            assert manager.installed_snapshot() == listing
+            assert manager.installed_snapshot() == listing
+            assert get.call_count == 1
+
+            with patch("onepkg.managers.run_process", return_value=MagicMock(returncode=0)):
+                manager.install(["ripgrep"])
+            manager.installed_snapshot()
+            assert get.call_count == 2
+
+    @patch("onepkg.managers.detect_shell", return_value="/bin/sh")
+    @patch("onepkg.managers.stream_lines")
+    def test_get_installed_packages_parses_streamed_lines(self, mock_stream, mock_shell):
+        """Installed formulae are parsed from streamed output."""
+        mock_stream.return_value = iter(["fzf 0.48.1\n", "git 2.44.0 2.45.0\n", "\n"])
+        packages = BrewManager().get_installed_packages()
+        assert [(p.name, p.version) for p in packages] == [("fzf", "0.48.1"), ("git", "2.45.0")]
+
 
 class TestPythonManager:
     """Tests for PythonManager (uv)."""
@@ -131,6 +329,74 @@ class TestPythonManager:
         assert manager.tool == "uv"
         assert manager.color == "yellow"
 
+    def test_remove_batches_packages(self):
+        """Uninstalls share a single uv invocation."""
+        manager = PythonManager()
+        with patch.object(manager, "_run_command", return_value=CommandResult(success=True)) as run:
+            manager.remove(["ruff", "black"])
+        run.assert_called_once_with(["uv", "tool", "uninstall", "ruff", "black"], False)
+
+    def test_get_installed_packages_skips_binary_lines(self):
+        """Only tool header lines become packages."""
+        manager = PythonManager()
+        listing = ["black v24.3.0\n", "- black\n", "- blackd\n", "ruff v0.4.1\n", "- ruff\n"]
+        with patch.object(manager, "_query_lines", return_value=iter(listing)):
+            packages = manager.get_installed_packages()
+        assert [(p.name, p.version) for p in packages] == [("black", "24.3.0"), ("ruff", "0.4.1")]
+
+    def test_has_package_checks_tool_dir(self, tmp_path, monkeypatch):
+        """A uv tool is installed exactly when its venv directory exists."""
+        (tmp_path / "ruff").mkdir()
+        monkeypatch.setenv("UV_TOOL_DIR", str(tmp_path))
+        manager = PythonManager()
+        assert manager.has_package("ruff")
+        assert not manager.has_package("black")
+
+    def test_package_details_fall_back_to_single_listing(self, tmp_path, monkeypatch):
+        """Without a tool dir, version and binaries come from one `uv tool list` pass."""
+        monkeypatch.setenv("UV_TOOL_DIR", str(tmp_path))
+        manager = PythonManager()
+        listing = ["black v24.3.0\n", "- black\n", "- blackd\n", "ruff v0.4.1\n", "- ruff\n"]
+        with patch.object(manager, "_query_lines", return_value=iter(listing)) as query:
+            details = manager.get_package_details("black")
+        query.assert_called_once()
+        assert details.version == "24.3.0"
+        assert details.binaries == ["black", "blackd"]
+
+    def test_package_details_read_from_metadata(self, tmp_path, monkeypatch):
+        """Details come from the tool's dist-info without running uv."""
+        monkeypatch.delenv("UV_TOOL_DIR", raising=False)
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+        site = tmp_path / "uv/tools/black/lib/python3.12/site-packages"
+        dist_info = site / "black-24.3.0.dist-info"
+        dist_info.mkdir(parents=True)
+        (dist_info / "entry_points.txt").write_text(
+            "[console_scripts]\nblack = black:patched_main\nblackd = blackd:patched_main\n"
+        )
+        (dist_info / "METADATA").write_text(
+            "Metadata-Version: 2.1\n"
+            "Name: black\n"
+            "Version: 24.3.0\n"
+            "Summary: The uncompromising code formatter.\n"
+            "License: MIT\n"
+            "Project-URL: Homepage, https://github.com/psf/black\n"
+            "Requires-Dist: click>=8.0.0\n"
+            "Requires-Dist: colorama>=0.4.3; extra == 'colorama'\n"
+            "\n"
+            "Long description\n"
+        )
+        manager = PythonManager()
+        with patch.object(manager, "_query_lines") as query:
+            details = manager.get_package_details("black")
+        query.assert_not_called()
+        assert details.version == "24.3.0"
+        assert details.binaries == ["black", "blackd"]
+        assert details.summary == "The uncompromising code formatter."
+        assert details.license == "MIT"
+        assert details.homepage == "https://github.com/psf/black"
+        assert details.requires == ["click"]
+        assert details.location == str(site)
+
 
 class TestRustManager:
     """Tests for RustManager (cargo)."""
@@ -142,6 +408,257 @@ class TestRustManager:
         assert manager.tool == "cargo"
         assert manager.color == "red"
 
+    @patch("onepkg.managers.shutil.which")
+    def test_install_self_forgets_missing_tool(self, mock_shutil_which):
+        """A manager bootstrapped mid-run is found afterwards."""
+        mock_shutil_which.return_value = None
+        manager = RustManager()
+        assert not manager.is_available()
+        mock_shutil_which.return_value = "/home/user/.cargo/bin/cargo"
+        with patch.object(manager, "_run_command", return_value=CommandResult(success=True)):
+            assert manager.install_self().success
+        assert manager.is_available()
+
+    def test_listing_cached_on_disk_until_crates_change(self, tmp_path, monkeypatch):
+        """A fresh manager reuses the last listing while .crates2.json is unchanged."""
+        monkeypatch.setenv("CARGO_HOME", str(tmp_path))
+        crates = tmp_path / ".crates2.json"
+        crates.write_text("{}")
+        listing = [PackageInfo(name="bat", version="0.24.0")]
+        with patch.object(RustManager, "get_installed_packages", return_value=listing) as get:
+            assert RustManager().installed_snapshot() == listing
+            assert RustManager().installed_snapshot() == listing
+            assert get.call_count == 1
+
+            os.utime(crates, ns=(0, 1))
+            RustManager().installed_snapshot()
+            assert get.call_count == 2
+
+    def test_reads_crates2_json(self, tmp_path, monkeypatch):
+        """Installed crates and their binaries come from .crates2.json without cargo."""
+        monkeypatch.setenv("CARGO_HOME", str(tmp_path))
+        installs = {
+            "ripgrep 14.1.0 (registry+https://github.com/rust-lang/crates.io-index)": {
+                "bins": ["rg"]
+            },
+            "bat 0.24.0 (registry+https://github.com/rust-lang/crates.io-index)": {"bins": ["bat"]},
+        }
+        (tmp_path / ".crates2.json").write_text(json.dumps({"installs": installs}))
+        manager = RustManager()
+        with patch.object(manager, "_query_lines") as query:
+            packages = manager.get_installed_packages()
+            details = manager.get_package_details("ripgrep")
+        query.assert_not_called()
+        assert sorted((p.name, p.version) for p in packages) == [
+            ("bat", "0.24.0"),
+            ("ripgrep", "14.1.0"),
+        ]
+        assert details.binaries == ["rg"]
+
+    def test_package_details_stops_at_next_crate(self, tmp_path, monkeypatch):
+        """Without .crates2.json, details return as soon as the next crate header is read."""
+        monkeypatch.setenv("CARGO_HOME", str(tmp_path))
+        manager = RustManager()
+        read = []
+
+        def lines():
+            for line in ["bat v0.24.0:\n", "    bat\n", "ripgrep v14.1.0:\n", "    rg\n"]:
+                read.append(line)
+                yield line
+
+        with patch.object(manager, "_query_lines", return_value=lines()):
+            details = manager.get_package_details("bat")
+        assert (details.version, details.binaries) == ("0.24.0", ["bat"])
+        assert len(read) == 3
+
+
+class TestCondaManager:
+    """Tests for CondaManager (micromamba)."""
+
+    def test_get_installed_packages_skips_pypi(self):
+        """Records installed from PyPI are not conda packages."""
+        records = [
+            {"name": "numpy", "version": "1.26.4", "channel": "conda-forge"},
+            {"name": "rich", "version": "13.7.1", "channel": "pypi"},
+        ]
+        manager = CondaManager()
+        with patch.object(manager, "_query", return_value=MagicMock(stdout=json.dumps(records))):
+            packages = manager.get_installed_packages()
+        assert [(p.name, p.version) for p in packages] == [("numpy", "1.26.4")]
+
+
+class TestGoManager:
+    """Tests for GoManager."""
+
+    @patch("onepkg.managers.detect_shell", return_value="/bin/sh")
+    @patch("onepkg.managers.subprocess.run")
+    def test_get_installed_packages_reads_each_binary(
+        self, mock_run, mock_shell, tmp_path, monkeypatch
+    ):
+        """Each binary in GOBIN is inspected for its module path and version."""
+        monkeypatch.setenv("GOBIN", str(tmp_path))
+        names = ["lazygit", "glow", "fzf"]
+        for name in names:
+            (tmp_path / name).write_text("")
+
+        def fake_run(cmd, **kwargs):
+            binary = cmd[-1].split()[-1].rsplit("/", 1)[-1]
+            return MagicMock(
+                returncode=0,
+                stdout=f"{binary}: go1.22\n\tpath\tgithub.com/x/{binary}\n\tmod\tgithub.com/x/{binary}\tv1.0.0\n",
+            )
+
+        mock_run.side_effect = fake_run
+        packages = GoManager().get_installed_packages()
+
+        expected = sorted(f"github.com/x/{n}" for n in names)
+        assert sorted(p.name for p in packages) == expected
+        assert all(p.version == "v1.0.0" for p in packages)
+
+    def test_install_defaults_to_latest_and_captures_parallel_output(self):
+        """Modules install via _go_install; parallel builds capture their output."""
+        manager = GoManager()
+        with patch.object(manager, "_run_command", return_value=CommandResult(success=True)) as run:
+            assert manager.install(["github.com/x/glow", "github.com/x/fzf@v0.1.0"]).success
+        assert sorted(call.args[0][-1] for call in run.call_args_list) == [
+            "github.com/x/fzf@v0.1.0",
+            "github.com/x/glow@latest",
+        ]
+        assert all(call.kwargs["capture"] for call in run.call_args_list)
+
+    @patch("onepkg.managers.which", return_value="/usr/local/go/bin/go")
+    @patch("onepkg.managers.subprocess.run")
+    def test_captured_command_prints_output_once(self, mock_run, mock_which):
+        """A captured run prints its echo and output together and reports failure."""
+        mock_run.return_value = MagicMock(returncode=1, stdout="main.go:1: [error]\n")
+        with patch("onepkg.managers.console") as mock_console:
+            result = GoManager()._run_command(["go", "install", "x@latest"], capture=True)
+        assert result.success is False
+        mock_console.print.assert_called_once()
+        assert "main.go:1: \\[error]" in mock_console.print.call_args.args[0]
+
+
+class TestWingetManager:
+    """Tests for WingetManager."""
+
+    def test_install_runs_one_call_per_package(self):
+        """Each id gets its own winget call; failures are reported by id."""
+        manager = WingetManager()
+
+        def fake_run(cmd, dry_run=False, **kwargs):
+            return CommandResult(success=cmd[-1] != "Bad.Id")
+
+        with patch.object(manager, "_run_command", side_effect=fake_run) as run:
+            result = manager.install(["Git.Git", "Bad.Id", "Mozilla.Firefox"])
+        assert manager.max_workers == 1
+        # Serial, so calls run in the order given
+        assert [call.args[0][-1] for call in run.call_args_list] == [
+            "Git.Git",
+            "Bad.Id",
+            "Mozilla.Firefox",
+        ]
+        assert result.success is False
+        assert result.message == "Failed to process: Bad.Id"
+
+    def test_package_details_parse_show_fields(self):
+        """The first value of each wanted field is used; other lines are ignored."""
+        output = (
+            "Found Git [Git.Git]\n"
+            "Version: 2.45.1\n"
+            "Publisher: The Git Development Community\n"
+            "Description: Git is a free and open source version control system.\n"
+            "Homepage: https://gitforwindows.org\n"
+            "License: GPL-2.0\n"
+            "Installer:\n"
+            "  Installer Url: https://github.com/git-for-windows/git/releases\n"
+        )
+        manager = WingetManager()
+        with patch.object(manager, "_query", return_value=MagicMock(stdout=output)):
+            details = manager.get_package_details("Git.Git")
+        assert (details.version, details.license) == ("2.45.1", "GPL-2.0")
+        assert details.homepage == "https://gitforwindows.org"
+        assert details.summary.startswith("Git is a free")
+
+
+class TestBunManager:
+    """Tests for BunManager."""
+
+    def test_get_installed_packages_parses_tree(self):
+        """Tree entries are split at the last "@", keeping package scopes."""
+        listing = [
+            "/home/user/.bun/install/global node_modules (2)\n",
+            "├── @biomejs/biome@1.7.3\n",
+            "└── typescript@5.4.5\n",
+        ]
+        manager = BunManager()
+        with patch.object(manager, "_query_lines", return_value=iter(listing)):
+            packages = manager.get_installed_packages()
+        assert [(p.name, p.version) for p in packages] == [
+            ("@biomejs/biome", "1.7.3"),
+            ("typescript", "5.4.5"),
+        ]
+
+    def test_update_batches_and_never_overlaps(self):
+        """Named updates share one bun call, and bun is never run concurrently."""
+        manager = BunManager()
+        assert manager.max_workers == 1
+        with patch.object(manager, "_run_command", return_value=CommandResult(success=True)) as run:
+            manager.update(["prettier", "tsx"])
+        run.assert_called_once_with(["bun", "update", "-g", "prettier", "tsx"], False)
+
+    def test_details_cached_on_disk_until_globals_change(self, tmp_path, monkeypatch):
+        """show's details lookup is reused across runs while package.json is unchanged."""
+        monkeypatch.setenv("BUN_INSTALL", str(tmp_path))
+        package_json = tmp_path / "install" / "global" / "package.json"
+        package_json.parent.mkdir(parents=True)
+        package_json.write_text("{}")
+        details = PackageDetails(name="@biomejs/biome", version="1.7.3", license="MIT")
+        with patch.object(BunManager, "get_package_details", return_value=details) as get:
+            assert BunManager().cached_details("@biomejs/biome") == details
+            assert BunManager().cached_details("@biomejs/biome") == details
+            assert get.call_count == 1
+
+            os.utime(package_json, ns=(0, 1))
+            BunManager().cached_details("@biomejs/biome")
+            assert get.call_count == 2
+
+    def test_details_cache_keeps_similar_names_apart(self, tmp_path, monkeypatch):
+        """Names that escape or case-fold alike get separate cache entries."""
+        monkeypatch.setenv("BUN_INSTALL", str(tmp_path))
+        package_json = tmp_path / "install" / "global" / "package.json"
+        package_json.parent.mkdir(parents=True)
+        package_json.write_text("{}")
+        names = ["@scope/tool", "@scope--tool", "Tool", "tool"]
+
+        def details(name):
+            return None if name == "tool" else PackageDetails(name=name, version="1.0")
+
+        with patch.object(BunManager, "get_package_details", side_effect=details):
+            for name in names:
+                BunManager().cached_details(name)
+            cached = [BunManager().cached_details(name) for name in names]
+        assert [d.name if d else None for d in cached] == [
+            "@scope/tool",
+            "@scope--tool",
+            "Tool",
+            None,
+        ]
+
+    def test_details_miss_cached_until_globals_change(self, tmp_path, monkeypatch):
+        """A package bun does not have is not looked up again until the globals change."""
+        monkeypatch.setenv("BUN_INSTALL", str(tmp_path))
+        package_json = tmp_path / "install" / "global" / "package.json"
+        package_json.parent.mkdir(parents=True)
+        package_json.write_text("{}")
+        with patch.object(BunManager, "get_package_details", return_value=None) as get:
+            assert BunManager().cached_details("ruff") is None
+            assert BunManager().cached_details("ruff") is None
+            assert get.call_count == 1
+
+            os.utime(package_json, ns=(0, 1))
+            BunManager().cached_details("ruff")
+            assert get.call_count == 2
+
 
 class TestCustomManager:
     """Tests for CustomManager."""
@@ -182,6 +699,39 @@ class TestCustomManager:
         )
         assert manager.is_installed(config) is False
 
+    @patch("onepkg.managers.subprocess.run")
+    def test_check_installed_preserves_order(self, mock_run):
+        """Concurrent checks report results in input order."""
+        mock_run.side_effect = lambda cmd, **kwargs: MagicMock(
+            returncode=0 if "ok" in cmd[-1] else 1
+        )
+        manager = CustomManager()
+        configs = [
+            CustomPackageConfig(
+                name=name, install="echo install", check=f"check {name}", shell="fish"
+            )
+            for name in ["ok-a", "bad", "ok-b"]
+        ]
+        assert manager.check_installed(configs) == [True, False, True]
+        assert mock_run.call_count == 3
+
+    @patch("onepkg.managers.subprocess.run")
+    def test_check_installed_batches_posix_shell(self, mock_run):
+        """Checks for one POSIX shell share a login shell; profile output is ignored."""
+        mock_run.return_value = MagicMock(
+            stdout="Welcome!\n__onepkg_check__ 0\n__onepkg_check__ 1\n__onepkg_check__ 0\n"
+        )
+        manager = CustomManager()
+        configs = [
+            CustomPackageConfig(
+                name=name, install="echo install", check=f"check {name}", shell="sh"
+            )
+            for name in ["ok-a", "bad", "ok-b"]
+        ]
+        configs.append(CustomPackageConfig(name="no-check", install="echo install", shell="sh"))
+        assert manager.check_installed(configs) == [True, False, True, False]
+        mock_run.assert_called_once()
+
     def test_is_not_installed_without_check_command(self):
         """Package status unknown without check command."""
         manager = CustomManager()
@@ -211,3 +761,13 @@ class TestCustomManager:
             install="echo install",
         )
         assert manager._get_shell(config) == "/bin/zsh"
+
+    def test_load_specs_reuses_parse_cache(self):
+        """A later process loads the bundled specs without parsing YAML."""
+        load_specs.cache_clear()
+        specs = load_specs()
+        load_specs.cache_clear()
+        with patch("onepkg.managers.load_yaml") as mock_load:
+            assert load_specs() == specs
+        mock_load.assert_not_called()
+        load_specs.cache_clear()
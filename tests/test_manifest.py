@@ -4,16 +4,20 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 
 from onepkg.manifest import (
+    find_manifest,
     load_manifest,
     save_manifest,
     update_raw_manifest,
     get_category_for_type,
+    get_installed_names,
 )
-from onepkg.managers import CATEGORIES
+from onepkg.managers import CATEGORIES, BrewManager, WingetManager
+from onepkg.models import PackageInfo
 
 # Aliases for compatibility with existing tests
 _load_manifest = load_manifest
@@ -76,6 +80,48 @@ class TestLoadManifest:
         with pytest.raises(SystemExit):
             _load_manifest("/nonexistent/path/manifest.yaml")
 
+    def test_find_manifest_does_not_parse(self, temp_manifest):
+        """Locating the manifest (e.g. for `edit`) skips the YAML parse."""
+        with patch("onepkg.manifest.load_yaml") as mock_load:
+            assert find_manifest(temp_manifest) == Path(temp_manifest)
+        mock_load.assert_not_called()
+
+    def test_reload_uses_parse_cache(self, temp_manifest):
+        """A second load of an unchanged file is served from the cache."""
+        _load_manifest(temp_manifest)
+        with patch("onepkg.manifest.load_yaml") as mock_load:
+            _, raw_data, _ = _load_manifest(temp_manifest)
+        mock_load.assert_not_called()
+        assert raw_data["custom"] == ["fisher"]
+
+    def test_parse_cache_written_atomically(self, temp_manifest):
+        """The parse cache is renamed into place, leaving no temp file behind."""
+        from onepkg.utils import get_cache_dir
+
+        _load_manifest(temp_manifest)
+        names = [p.name for p in get_cache_dir().iterdir()]
+        assert any(n.startswith("manifest-") and n.endswith(".pkl") for n in names)
+        assert not any(n.endswith(".tmp") for n in names)
+
+    def test_reload_after_change(self, temp_manifest):
+        """Modifying the file invalidates the parse cache."""
+        _load_manifest(temp_manifest)
+        with open(temp_manifest, "w") as f:
+            yaml.dump({"custom": ["my-tool"]}, f)
+        os.utime(temp_manifest, ns=(0, 1))
+        _, raw_data, _ = _load_manifest(temp_manifest)
+        assert raw_data == {"custom": ["my-tool"]}
+
+    def test_reload_after_change_with_same_mtime(self, temp_manifest):
+        """An edit that keeps the old mtime is still caught by the size."""
+        _load_manifest(temp_manifest)
+        st = os.stat(temp_manifest)
+        with open(temp_manifest, "w") as f:
+            yaml.dump({"custom": ["my-much-longer-tool-name"]}, f)
+        os.utime(temp_manifest, ns=(st.st_atime_ns, st.st_mtime_ns))
+        _, raw_data, _ = _load_manifest(temp_manifest)
+        assert raw_data == {"custom": ["my-much-longer-tool-name"]}
+
     def test_manifest_flattens_structure(self, temp_manifest):
         """Manifest should flatten nested structure."""
         data, raw_data, path = _load_manifest(temp_manifest)
@@ -83,6 +129,13 @@ class TestLoadManifest:
         # (depending on platform, mac packages may or may not be present)
         assert "python" in data or "brew" in data or "rust" in data
 
+    def test_non_list_sections_are_dropped(self, tmp_path):
+        """A scalar or empty type entry never reaches the flattened data."""
+        path = tmp_path / "packages.yaml"
+        path.write_text("general:\n  python: ruff\n  rust:\n  cargo: [bat]\ncustom: fisher\n")
+        data, _, _ = _load_manifest(str(path))
+        assert data == {"cargo": ["bat"]}
+
 
 class TestSaveManifest:
     """Tests for _save_manifest function."""
@@ -157,6 +210,26 @@ class TestUpdateRawManifest:
         assert "fisher" not in raw_data["custom"]
         assert "my-tool" in raw_data["custom"]
 
+    def test_remove_dict_entries(self):
+        """Entries written as dicts (e.g. with a platform) are removed by name."""
+        raw_data = {
+            "general": {"python": ["ruff", {"name": "black", "platform": "linux"}]},
+            "custom": [{"name": "my-tool", "platform": "darwin"}, "fisher"],
+        }
+        _update_raw_manifest(raw_data, "python", "black", "remove")
+        _update_raw_manifest(raw_data, "custom", "my-tool", "remove")
+        assert raw_data["general"]["python"] == ["ruff"]
+        assert raw_data["custom"] == ["fisher"]
+
+    def test_reports_whether_anything_changed(self):
+        """Callers only need to save when an entry was actually added or removed."""
+        raw_data = {"general": {"python": [{"name": "black", "platform": "linux"}]}}
+        assert _update_raw_manifest(raw_data, "python", "ruff", "add") is True
+        assert _update_raw_manifest(raw_data, "python", "ruff", "add") is False
+        assert _update_raw_manifest(raw_data, "python", "black", "add") is False
+        assert _update_raw_manifest(raw_data, "python", "isort", "remove") is False
+        assert _update_raw_manifest(raw_data, "python", "ruff", "remove") is True
+
     def test_add_duplicate_package(self):
         """Adding duplicate package should not create duplicate."""
         raw_data = {
@@ -195,3 +268,21 @@ class TestGetCategoryForType:
     def test_unknown_type(self):
         """Unknown type should return None."""
         assert _get_category_for_type("unknown") is None
+
+
+class TestGetInstalledNames:
+    """Tests for get_installed_names."""
+
+    def test_winget_names_include_lowercase_and_display_names(self):
+        """winget ids and display names can be matched case-insensitively."""
+        manager = WingetManager()
+        listing = [PackageInfo(name="Git.Git", version="2.45.1", display_name="Git")]
+        with patch.object(manager, "installed_snapshot", return_value=listing):
+            assert get_installed_names(manager) == {"Git.Git", "git.git", "Git", "git"}
+
+    def test_other_managers_use_exact_names(self):
+        """Other managers report package names as listed."""
+        manager = BrewManager()
+        listing = [PackageInfo(name="ripgrep", version="14.1.0")]
+        with patch.object(manager, "installed_snapshot", return_value=listing):
+            assert get_installed_names(manager) == {"ripgrep"}
@@ -2,8 +2,11 @@
 
 import pytest
 import tempfile
+import threading
+import time
 import os
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import yaml
 
@@ -15,9 +18,9 @@ from onepkg.manifest import (
     resolve_package_manager,
     resolve_all_packages,
 )
-from onepkg.utils import platform_matches
+from onepkg.utils import first_hit, login_path, platform_matches, run_parallel
 from onepkg.models import CustomPackageConfig
-from onepkg.managers import CUSTOM_MANAGER
+from onepkg.managers import CUSTOM_MANAGER, MANAGERS
 
 # Aliases for compatibility with existing tests
 _parse_package_entry = parse_package_entry
@@ -168,6 +171,20 @@ class TestFindPackageManifestType:
         assert _find_package_manifest_type("tmux", data) == "conda"
 
 
+class TestResolvePackageManager:
+    """Tests for resolve_package_manager."""
+
+    def test_inactive_preferred_manager_is_not_probed(self):
+        """A preferred manager outside the active categories is skipped without a PATH lookup."""
+        with patch("onepkg.manifest.get_active_types", return_value=frozenset({"conda", "brew"})):
+            with patch.object(MANAGERS["winget"], "is_available") as winget_available:
+                assert _resolve_package_manager("git", "winget", "conda") == "conda"
+            winget_available.assert_not_called()
+
+            with patch.object(MANAGERS["brew"], "is_available", return_value=True):
+                assert _resolve_package_manager("tmux", "brew", "conda") == "brew"
+
+
 class TestResolveAllPackages:
     """Tests for _resolve_all_packages function."""
 
@@ -190,6 +207,15 @@ class TestResolveAllPackages:
         resolved = _resolve_all_packages(data)
         assert resolved.get("custom") == ["fisher", "my-tool"]
 
+    def test_dict_entries_and_duplicates(self):
+        """Dict entries resolve to their names; duplicates collapse in order."""
+        data = {
+            "brew": ["fzf", {"name": "ripgrep", "platform": "darwin"}, "fzf"],
+            "python": ["ruff", "ruff"],
+        }
+        resolved = _resolve_all_packages(data)
+        assert resolved == {"brew": ["fzf", "ripgrep"], "python": ["ruff"]}
+
 
 class TestCustomPackageConfig:
     """Tests for CustomPackageConfig dataclass."""
@@ -245,3 +271,71 @@ class TestCustomManagerParseConfig:
         assert config.check == "which test"
         assert config.shell == "fish"
         assert config.depends == ["dep1"]
+
+
+class TestFirstHit:
+    """Tests for first_hit function."""
+
+    def test_hit_waits_for_running_probes(self):
+        """Probes already running finish before first_hit returns."""
+        finished = threading.Event()
+
+        def probe(item):
+            if item == "slow":
+                time.sleep(0.05)
+                finished.set()
+                return None
+            return item if item != "miss" else None
+
+        assert first_hit(probe, ["miss", "hit", "slow"]) == ("hit", "hit")
+        assert finished.is_set()
+
+    def test_error_raised_in_item_order(self):
+        """An exception from an item ahead of the hit propagates."""
+
+        def probe(item):
+            if item == "broken":
+                raise RuntimeError(item)
+            return item
+
+        with pytest.raises(RuntimeError):
+            first_hit(probe, ["broken", "hit"])
+
+    def test_earlier_hit_wins_over_faster_later_one(self):
+        """Results are taken in item order, not completion order."""
+
+        def probe(item):
+            if item == "first":
+                time.sleep(0.05)
+            return item.upper()
+
+        assert first_hit(probe, ["first", "second"]) == ("first", "FIRST")
+
+    def test_no_hit(self):
+        """None when every item comes back empty."""
+        assert first_hit(lambda item: None, ["a", "b"]) is None
+
+
+class TestLoginPath:
+    """Tests for login_path function."""
+
+    def test_concurrent_first_calls_spawn_one_shell(self):
+        """Threads racing on a cold cache share a single login shell."""
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            time.sleep(0.05)
+            return MagicMock(stdout="HOME=/root\nPATH=/opt/bin:/usr/bin\n")
+
+        login_path.cache_clear()
+        try:
+            with (
+                patch("onepkg.utils.detect_shell", return_value="/bin/sh"),
+                patch("onepkg.utils.run_process", side_effect=fake_run),
+            ):
+                results = run_parallel(lambda _: login_path(), range(8))
+        finally:
+            login_path.cache_clear()
+        assert results == ["/opt/bin:/usr/bin"] * 8
+        assert len(calls) == 1